@@ -9,6 +9,7 @@ import sys
 
 # Import from our module structure
 from ai_core.gui.main_window import MainWindow
+from ai_core.emotions._emotion_kernels import warmup as warmup_emotion_kernels
 
 # Configure logging
 logging.basicConfig(
@@ -28,6 +29,9 @@ def main():
         print("Starting AI Companion application")
         logger.info("Starting AI Companion application")
         
+        # Make sure the emotion kernels are compiled before the UI starts
+        warmup_emotion_kernels()
+        
         # Create the main window
         root = tk.Tk()
         print("Tkinter root window created")
@@ -2,14 +2,17 @@
 Core controller for the AI avatar's behavior and decision making.
 """
 from typing import Dict, Any, Optional
+from types import MappingProxyType
 import numpy as np
 
 class AvatarController:
     def __init__(self):
         """Initialize the avatar controller with default settings."""
+        # Position and rotation share one buffer: [x, y, z, rx, ry, rz]
+        self._pose = np.zeros(6, dtype=np.float32)
         self.state = {
-            'position': np.zeros(3),
-            'rotation': np.zeros(3),
+            'position': self._pose[:3],
+            'rotation': self._pose[3:],
             'current_action': None,
             'environment_state': {},
             'user_interaction': None
@@ -17,6 +20,12 @@ class AvatarController:
         
     def update_state(self, new_state: Dict[str, Any]) -> None:
         """Update the current state of the avatar."""
+        new_state = dict(new_state)
+        # Write pose values into the shared buffer instead of replacing the views
+        if 'position' in new_state:
+            self._pose[:3] = new_state.pop('position')
+        if 'rotation' in new_state:
+            self._pose[3:] = new_state.pop('rotation')
         self.state.update(new_state)
         
     def decide_action(self) -> Dict[str, Any]:
@@ -34,6 +43,6 @@ class AvatarController:
         """Process user input and update the avatar's behavior accordingly."""
         self.state['user_interaction'] = user_input
         
-    def get_current_state(self) -> Dict[str, Any]:
-        """Return the current state of the avatar."""
-        return self.state.copy() 
\ No newline at end of file
+    def get_current_state(self) -> MappingProxyType:
+        """Return a read-only view of the current state of the avatar."""
+        return MappingProxyType(self.state) 
\ No newline at end of file
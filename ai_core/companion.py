@@ -33,6 +33,21 @@ class AICompanion:
             'environment_context': {}
         }
         
+        # Input key -> handler, checked in order by process_input
+        self._handlers = (
+            ('text', self._process_text_input),
+            ('voice', self._process_voice_input),
+            ('gesture', self._process_gesture_input)
+        )
+        
+        # Reused by get_response instead of building a new dict per call
+        self._response_buffer = {
+            'text': '',
+            'emotion': None,
+            'behavior': None,
+            'animation': {'type': 'idle', 'parameters': {}}
+        }
+        
     def start_interaction(self) -> None:
         """Start a new interaction session with the AI companion."""
         self.current_state['is_interacting'] = True
@@ -60,12 +75,10 @@ class AICompanion:
         self.current_state['environment_context'] = input_data.get('environment', {})
         
         # Process different types of input
-        if 'text' in input_data:
-            self._process_text_input(input_data['text'])
-        if 'voice' in input_data:
-            self._process_voice_input(input_data['voice'])
-        if 'gesture' in input_data:
-            self._process_gesture_input(input_data['gesture'])
+        for key, handler in self._handlers:
+            value = input_data.get(key)
+            if value is not None:
+                handler(value)
             
         # Update emotional state based on all inputs
         self.emotions.update_state(input_data)
@@ -83,6 +96,7 @@ class AICompanion:
                 - voice: Voice response data
                 - animation: Animation data
                 - emotion: Current emotional state
+            The same dictionary is reused and only valid until the next call.
         """
         # Get current emotional state
         emotion = self.emotions.get_current_emotion()
@@ -95,15 +109,13 @@ class AICompanion:
             context=self.current_state['environment_context']
         )
         
-        # Generate text response
-        text_response = self._generate_text_response(behavior, emotion)
-        
-        return {
-            'text': text_response,
-            'emotion': emotion,
-            'behavior': behavior,
-            'animation': self._generate_animation_data(behavior, emotion)
-        }
+        # Fill the response buffer in place
+        response = self._response_buffer
+        response['text'] = self._generate_text_response(behavior, emotion)
+        response['emotion'] = emotion
+        response['behavior'] = behavior
+        response['animation'] = self._generate_animation_data(behavior, emotion)
+        return response
         
     def _process_text_input(self, text: str) -> None:
         """Process text input from the user."""
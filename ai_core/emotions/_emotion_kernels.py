@@ -0,0 +1,89 @@
+"""
+Numeric kernels for the emotion engine.
+
+The kernels operate in place on the float32 emotion vector owned by
+EmotionEngine. They are compiled with Numba when it is installed and run
+as plain NumPy code otherwise. Explicit signatures make Numba compile them
+at import time, and cache=True keeps the machine code on disk between runs.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+# Storage type for every emotion vector; must match the float32 kernel signatures
+DTYPE = np.float32
+
+
+@njit('void(float32[::1], float64)', cache=True, fastmath=True)
+def apply_decay(vec, rate):
+    """Subtract the decay rate from every emotion, flooring at 0."""
+    vec -= rate
+    np.maximum(vec, 0.0, vec)
+
+
+@njit('void(float32[::1], float32[::1], float64, float64)', cache=True, fastmath=True)
+def apply_update(vec, delta, factor, rate):
+    """Add deltas, clip to [0, 1], dampen and decay in a single pass."""
+    for i in range(vec.shape[0]):
+        v = min(max(vec[i] + delta[i], 0.0), 1.0) * factor - rate
+        vec[i] = max(v, 0.0)
+
+
+@njit('void(float32[:, ::1], float32[:, ::1], float64, float64[::1])',
+      cache=True, fastmath=True, parallel=True)
+def apply_update_batch(vecs, deltas, factor, rates):
+    """apply_update for a (M, N) stack of emotion vectors, rows in parallel."""
+    for m in prange(vecs.shape[0]):
+        rate = rates[m]
+        for i in range(vecs.shape[1]):
+            v = min(max(vecs[m, i] + deltas[m, i], 0.0), 1.0) * factor - rate
+            vecs[m, i] = max(v, 0.0)
+
+
+@njit('void(float32[:, ::1], boolean[:, ::1], int32[::1], float32[:, ::1], int32[::1], float32[::1])',
+      cache=True, fastmath=True, parallel=True)
+def classify(targets, mask, counts, vecs, out_idx, out_conf):
+    """
+    Find the best-matching complex state for each row of vecs.
+    
+    Writes the state index (-1 if no state scores above 0) and its
+    confidence into out_idx/out_conf.
+    """
+    for b in prange(vecs.shape[0]):
+        best_idx = -1
+        best_conf = 0.0
+        for s in range(targets.shape[0]):
+            conf = 0.0
+            for e in range(targets.shape[1]):
+                if mask[s, e]:
+                    conf += 1.0 - abs(targets[s, e] - vecs[b, e])
+            conf /= counts[s]
+            if conf > best_conf:
+                best_conf = conf
+                best_idx = s
+        out_idx[b] = best_idx
+        out_conf[b] = best_conf
+
+
+def warmup():
+    """Run each kernel once so first use on the UI thread is not delayed."""
+    dummy = np.zeros(8, dtype=DTYPE)
+    apply_decay(dummy, 0.1)
+    apply_update(dummy, np.zeros_like(dummy), 0.95, 0.1)
+    batch = np.zeros((2, 8), dtype=DTYPE)
+    apply_update_batch(batch, np.zeros_like(batch), 0.95, np.full(2, 0.1))
+    classify(np.zeros((1, 8), dtype=DTYPE), np.ones((1, 8), dtype=bool),
+             np.full(1, 8, dtype=np.int32), batch,
+             np.empty(2, dtype=np.int32), np.empty(2, dtype=DTYPE))
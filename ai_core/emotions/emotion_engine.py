@@ -1,29 +1,113 @@
 """
 Core emotion processing engine.
 """
-from typing import Dict, Any, List, Optional
-import json
-import random
+from typing import Dict, Any, Iterable, List, Optional
+from collections import deque
+from types import MappingProxyType
+import re
+import sys
+import time
+import numpy as np
+
+from ._emotion_kernels import DTYPE as _DTYPE, apply_decay, apply_update, apply_update_batch
 
 class EmotionEngine:
+    __slots__ = (
+        '_vec', 'emotional_state',
+        'emotion_history', '_hist_ts', '_hist_text', '_hist_idx', '_hist_full',
+        'context_history',
+        '_state_version', '_cached_version', '_cached_view',
+        '_cached_current_version', '_cached_current_view',
+        'decay_rate', 'personality_type', 'personality_traits',
+        '_sensitivity', '_intensity', '_adjusted_decay'
+    )
+    
+    # Number of past states kept in the history buffers
+    HISTORY_CAP = 100
+    
+    # Fixed emotion order for the state vector (interned, so names taken
+    # from it are shared singletons)
+    EMOTION_NAMES = tuple(sys.intern(name) for name in (
+        'joy',
+        'sadness',
+        'anger',
+        'fear',
+        'surprise',
+        'love',
+        'excitement',
+        'contentment'
+    ))
+    _IDX = {name: i for i, name in enumerate(EMOTION_NAMES)}
+    
+    # Keywords that trigger each emotion
+    EMOTION_KEYWORDS = {
+        'joy': ('happy', 'joy', 'excited', 'glad', 'wonderful'),
+        'sadness': ('sad', 'unhappy', 'depressed', 'miserable'),
+        'anger': ('angry', 'mad', 'furious', 'annoyed'),
+        'fear': ('afraid', 'scared', 'fearful', 'worried'),
+        'surprise': ('surprised', 'shocked', 'amazed'),
+        'love': ('love', 'adore', 'cherish', 'passionate'),
+        'excitement': ('excited', 'thrilled', 'enthusiastic'),
+        'contentment': ('content', 'satisfied', 'peaceful')
+    }
+    
+    # Keyword -> indices of the emotions it triggers
+    _KEYWORD_EMOTIONS = {}
+    for _emotion, _keywords in EMOTION_KEYWORDS.items():
+        for _keyword in _keywords:
+            _KEYWORD_EMOTIONS.setdefault(_keyword, []).append(_IDX[_emotion])
+    del _emotion, _keywords, _keyword
+    
+    _KEYWORDS = frozenset(_KEYWORD_EMOTIONS)
+    
+    # Splits text into lowercase words for keyword lookup
+    _WORD_RE = re.compile(r"[a-z]+")
+
+    # Environmental factor -> (low threshold, high threshold,
+    #                          changes below low, changes above high).
+    # 'intensity' adjusts the overall intensity rather than an emotion.
+    ENVIRONMENT_RULES = {
+        'brightness': (0.3, 0.7, {'intensity': 0.1}, {'joy': 0.1, 'excitement': 0.1}),
+        'noise_level': (0.3, 0.7, {'intensity': 0.2}, {'excitement': 0.2, 'intensity': -0.2}),
+        'temperature': (18, 28, {'sadness': 0.1}, {'anger': 0.1, 'intensity': -0.1})  # Too cold / too hot
+    }
+    
+    # Factor -> (low, high, deltas); deltas rows are below/between/above the
+    # thresholds and the last column holds the intensity change
+    _ENV_TABLES = {}
+    for _factor, (_low, _high, _below, _above) in ENVIRONMENT_RULES.items():
+        _deltas = np.zeros((3, len(EMOTION_NAMES) + 1))
+        for _row, _changes in ((0, _below), (2, _above)):
+            for _name, _amount in _changes.items():
+                _deltas[_row, _IDX.get(_name, len(EMOTION_NAMES))] = _amount
+        _ENV_TABLES[_factor] = (_low, _high, _deltas)
+    del _factor, _low, _high, _below, _above, _deltas, _row, _changes, _name, _amount
+
     def __init__(self):
         """Initialize the emotion engine with default emotional state."""
+        # Emotion intensities, indexed by EMOTION_NAMES
+        self._vec = np.zeros(len(self.EMOTION_NAMES), dtype=_DTYPE)
         self.emotional_state = {
-            'emotions': {
-                'joy': 0.0,
-                'sadness': 0.0,
-                'anger': 0.0,
-                'fear': 0.0,
-                'surprise': 0.0,
-                'love': 0.0,
-                'excitement': 0.0,
-                'contentment': 0.0
-            },
             'primary_emotion': 'neutral',
             'intensity': 0.0,
             'personality': 'balanced'
         }
         
+        # History ring buffer of emotion vectors, oldest overwritten first
+        self.emotion_history = np.empty((self.HISTORY_CAP, len(self.EMOTION_NAMES)), dtype=_DTYPE)
+        self._hist_ts = np.empty(self.HISTORY_CAP, dtype=np.float64)
+        self._hist_text = [None] * self.HISTORY_CAP
+        self._hist_idx = 0
+        self._hist_full = False
+        self.context_history = deque(maxlen=self.HISTORY_CAP)
+        
+        # Read-only state views, rebuilt lazily when the version changes
+        self._state_version = 0
+        self._cached_version = -1
+        self._cached_view = None
+        self._cached_current_version = -1
+        self._cached_current_view = None
+        
         # Emotion decay rate (per update)
         self.decay_rate = 0.1
         
@@ -46,149 +130,292 @@ class EmotionEngine:
                 'decay_modifier': 1.3
             }
         }
+        self._refresh_personality_cache()
+
+    def _refresh_personality_cache(self) -> None:
+        """Cache the scalars derived from the active personality."""
+        traits = self.personality_traits[self.personality_type]
+        self._sensitivity = traits['emotional_sensitivity']
+        self._intensity = traits['response_intensity']
+        self._adjusted_decay = self.decay_rate * traits['decay_modifier']
+
+    def get_emotional_state(self) -> MappingProxyType:
+        """
+        Get the current emotional state.
+        
+        Returns a read-only view that is shared between calls until the
+        state changes. Copy it with dict() if a mutable snapshot is needed.
+        """
+        if self._cached_version != self._state_version:
+            self._cached_view = MappingProxyType({
+                'emotions': MappingProxyType(dict(zip(self.EMOTION_NAMES, self._vec.tolist()))),
+                **self.emotional_state
+            })
+            self._cached_version = self._state_version
+        return self._cached_view
+
+    def update_state(self, input_data: Dict[str, Any]) -> None:
+        """
+        Update emotional state from all inputs of one update cycle.
+        
+        Args:
+            input_data: Dictionary that may contain
+                - text: Text input (string or {'text': ...})
+                - user_emotion: Emotion name or {emotion: intensity}
+                - environment: Environmental factors
+                - context: Context information stored with the history
+        """
+        delta = np.zeros(len(self.EMOTION_NAMES), dtype=_DTYPE)
+        intensity_delta = 0.0
+        
+        # Accumulate the contribution of every input first
+        text = input_data.get('text')
+        if isinstance(text, dict):
+            text = text.get('text')
+        if text:
+            self._accumulate_text(text, delta)
+            
+        user_emotion = input_data.get('user_emotion')
+        if isinstance(user_emotion, str):
+            user_emotion = {user_emotion: 1.0}
+        if user_emotion:
+            for emotion, value in user_emotion.items():
+                if value > 0:
+                    intensity_delta += self._accumulate_user_emotion(emotion.lower(), delta)
+                    
+        environment = input_data.get('environment')
+        if environment:
+            intensity_delta += self._accumulate_environment(environment, delta)
+            
+        # Then apply, clip, normalize and decay in one pass
+        apply_update(self._vec, delta, 0.95, self._adjusted_decay)
+        
+        # The intensity rules adjust the intensity of the new primary
+        # emotion, as in update_environment
+        self._update_primary_emotion()
+        if intensity_delta:
+            self._adjust_intensity(intensity_delta)
+        self._record_history(dict(input_data.get('context') or {'context_type': 'update'}), text)
+        self._state_version += 1
 
-    def get_emotional_state(self) -> dict:
-        """Get the current emotional state."""
-        return self.emotional_state.copy()
+    @staticmethod
+    def batch_update(vecs: np.ndarray, deltas: np.ndarray, rates: np.ndarray) -> None:
+        """
+        Apply one update cycle to many engines' emotion vectors at once.
+        
+        Rows are processed in parallel, with the same clip/normalize/decay
+        step as update_state().
+        
+        Args:
+            vecs: C-contiguous float32 array of shape (M, len(EMOTION_NAMES)),
+                updated in place
+            deltas: float32 array of the same shape with accumulated changes
+            rates: float64 array of shape (M,) with each engine's adjusted decay
+        """
+        apply_update_batch(vecs, deltas, 0.95, rates)
 
-    def process_text(self, text: str) -> None:
-        """Process input text and update emotional state."""
-        # Simple emotion detection based on keywords
-        text = text.lower()
+    def process_text(self, text: str, words: Optional[Iterable[str]] = None) -> None:
+        """
+        Process input text and update emotional state.
+        
+        Args:
+            text: Input text
+            words: Optional lowercase words of text that another analyzer
+                already split out (e.g. TextProcessor's token_set); saves
+                tokenizing the text again
+        """
+        delta = np.zeros(len(self.EMOTION_NAMES), dtype=_DTYPE)
+        self._accumulate_text(text, delta, words)
         
         # Update emotions based on keywords
-        self._update_emotion('joy', text, ['happy', 'joy', 'excited', 'glad', 'wonderful'])
-        self._update_emotion('sadness', text, ['sad', 'unhappy', 'depressed', 'miserable'])
-        self._update_emotion('anger', text, ['angry', 'mad', 'furious', 'annoyed'])
-        self._update_emotion('fear', text, ['afraid', 'scared', 'fearful', 'worried'])
-        self._update_emotion('surprise', text, ['surprised', 'shocked', 'amazed'])
-        self._update_emotion('love', text, ['love', 'adore', 'cherish', 'passionate'])
-        self._update_emotion('excitement', text, ['excited', 'thrilled', 'enthusiastic'])
-        self._update_emotion('contentment', text, ['content', 'satisfied', 'peaceful'])
+        apply_update(self._vec, delta, 1.0, 0.0)
         
         # Update primary emotion
         self._update_primary_emotion()
         
         # Apply emotional decay
         self._apply_decay()
+        
+        self._record_history({'context_type': 'text_input'}, text)
+        self._state_version += 1
 
-    def _update_emotion(self, emotion: str, text: str, keywords: list) -> None:
-        """Update specific emotion based on keywords."""
-        sensitivity = self.personality_traits[self.personality_type]['emotional_sensitivity']
-        intensity = self.personality_traits[self.personality_type]['response_intensity']
-        
-        for keyword in keywords:
-            if keyword in text:
-                current_value = self.emotional_state['emotions'][emotion]
-                increase = sensitivity * intensity
-                self.emotional_state['emotions'][emotion] = min(1.0, current_value + increase)
+    def _accumulate_text(self, text: str, delta: np.ndarray,
+                         words: Optional[Iterable[str]] = None) -> None:
+        """Add keyword-based emotion changes for the text to delta."""
+        # Simple emotion detection based on keywords: tokenize once, then
+        # intersect the words with the keyword set
+        if words is None:
+            words = self._WORD_RE.findall(text.lower())
+        matched = self._KEYWORDS.intersection(words)
+        if not matched:
+            return
+            
+        # Raise every emotion once per matched keyword
+        hits = np.zeros(len(self.EMOTION_NAMES), dtype=_DTYPE)
+        for keyword in matched:
+            hits[self._KEYWORD_EMOTIONS[keyword]] += 1
+            
+        delta += hits * (self._sensitivity * self._intensity)
 
     def _update_primary_emotion(self) -> None:
         """Update the primary emotion based on current emotional state."""
-        emotions = self.emotional_state['emotions']
-        max_emotion = max(emotions.items(), key=lambda x: x[1])
+        i = int(self._vec.argmax())
+        v = float(self._vec[i])
         
-        if max_emotion[1] > 0.2:  # Threshold for emotion to be considered primary
-            self.emotional_state['primary_emotion'] = max_emotion[0]
-            self.emotional_state['intensity'] = max_emotion[1]
+        if v > 0.2:  # Threshold for emotion to be considered primary
+            self.emotional_state['primary_emotion'] = self.EMOTION_NAMES[i]
+            self.emotional_state['intensity'] = v
         else:
             self.emotional_state['primary_emotion'] = 'neutral'
             self.emotional_state['intensity'] = 0.0
 
     def _apply_decay(self) -> None:
         """Apply emotional decay to all emotions."""
-        decay_modifier = self.personality_traits[self.personality_type]['decay_modifier']
-        adjusted_decay = self.decay_rate * decay_modifier
-        
-        for emotion in self.emotional_state['emotions']:
-            current_value = self.emotional_state['emotions'][emotion]
-            self.emotional_state['emotions'][emotion] = max(0.0, current_value - adjusted_decay)
+        apply_decay(self._vec, self._adjusted_decay)
 
     def set_personality(self, personality_type: str) -> bool:
         """Set the AI's personality type."""
         if personality_type in self.personality_traits:
             self.personality_type = personality_type
             self.emotional_state['personality'] = personality_type
+            self._refresh_personality_cache()
+            self._state_version += 1
             return True
         return False
 
     def reset_emotional_state(self) -> None:
         """Reset emotional state to neutral."""
-        for emotion in self.emotional_state['emotions']:
-            self.emotional_state['emotions'][emotion] = 0.0
+        self._vec.fill(0.0)
         self.emotional_state['primary_emotion'] = 'neutral'
         self.emotional_state['intensity'] = 0.0
+        self._state_version += 1
 
     def simulate_user_emotion(self, emotion: str) -> None:
         """Simulate receiving an emotion from the user."""
         emotion = emotion.lower()
-        if emotion in self.emotional_state['emotions']:
-            # Increase the specified emotion
-            self.emotional_state['emotions'][emotion] += 0.4
+        if emotion in self._IDX:
+            delta = np.zeros(len(self.EMOTION_NAMES), dtype=_DTYPE)
+            intensity_delta = self._accumulate_user_emotion(emotion, delta)
+            if intensity_delta:
+                self._adjust_intensity(intensity_delta)
+            
+            # Apply and normalize emotions
+            apply_update(self._vec, delta, 0.95, 0.0)
+            
+            self._record_history({'context_type': 'user_emotion', 'emotion': emotion})
+            self._state_version += 1
             
-            # Adjust related emotions
-            if emotion == 'joy':
-                self.emotional_state['emotions']['sadness'] -= 0.2
-                self.emotional_state['emotions']['excitement'] += 0.2
-            elif emotion == 'sadness':
-                self.emotional_state['emotions']['joy'] -= 0.2
-                self.emotional_state['emotions']['intensity'] += 0.1
-            elif emotion == 'anger':
-                self.emotional_state['emotions']['intensity'] -= 0.3
-                self.emotional_state['emotions']['joy'] -= 0.2
-                
-            # Normalize emotions
-            self._normalize_emotions()
+    def _accumulate_user_emotion(self, emotion: str, delta: np.ndarray) -> float:
+        """
+        Add the emotion changes caused by a user emotion to delta.
+        
+        Returns:
+            The change to the overall intensity, for the caller to apply
+        """
+        idx = self._IDX
+        if emotion not in idx:
+            return 0.0
+            
+        # Increase the specified emotion
+        delta[idx[emotion]] += 0.4
+        
+        # Adjust related emotions
+        if emotion == 'joy':
+            delta[idx['sadness']] -= 0.2
+            delta[idx['excitement']] += 0.2
+        elif emotion == 'sadness':
+            delta[idx['joy']] -= 0.2
+            return 0.1
+        elif emotion == 'anger':
+            delta[idx['joy']] -= 0.2
+            return -0.3
+        return 0.0
             
     def update_environment(self, env_data: Dict[str, Any]) -> None:
         """Update emotional state based on environmental factors."""
-        # Process environmental factors
-        if 'brightness' in env_data:
-            if env_data['brightness'] > 0.7:
-                self.emotional_state['emotions']['joy'] += 0.1
-                self.emotional_state['emotions']['excitement'] += 0.1
-            elif env_data['brightness'] < 0.3:
-                self.emotional_state['emotions']['intensity'] += 0.1
-                
-        if 'noise_level' in env_data:
-            if env_data['noise_level'] > 0.7:
-                self.emotional_state['emotions']['excitement'] += 0.2
-                self.emotional_state['emotions']['intensity'] -= 0.2
-            elif env_data['noise_level'] < 0.3:
-                self.emotional_state['emotions']['intensity'] += 0.2
-                
-        if 'temperature' in env_data:
-            if env_data['temperature'] > 28:  # Too hot
-                self.emotional_state['emotions']['anger'] += 0.1
-                self.emotional_state['emotions']['intensity'] -= 0.1
-            elif env_data['temperature'] < 18:  # Too cold
-                self.emotional_state['emotions']['sadness'] += 0.1
-                
-        # Normalize emotions
-        self._normalize_emotions()
-        
-    def get_current_state(self) -> Dict[str, Any]:
-        """Get the current emotional state."""
-        # Find the primary emotion (highest value)
-        primary_emotion = max(self.emotional_state['emotions'].items(), key=lambda x: x[1])[0]
-        
-        return {
-            'emotions': self.emotional_state['emotions'],
-            'primary_emotion': primary_emotion,
-            'personality': self.emotional_state['personality']
-        }
+        delta = np.zeros(len(self.EMOTION_NAMES), dtype=_DTYPE)
+        intensity_delta = self._accumulate_environment(env_data, delta)
+        if intensity_delta:
+            self._adjust_intensity(intensity_delta)
+        
+        # Apply and normalize emotions
+        apply_update(self._vec, delta, 0.95, 0.0)
         
-    def _normalize_emotions(self) -> None:
-        """Normalize emotion values to be between 0 and 1."""
-        # Ensure all emotions are between 0 and 1
-        for emotion in self.emotional_state['emotions']:
-            self.emotional_state['emotions'][emotion] = max(0.0, min(1.0, self.emotional_state['emotions'][emotion]))
+        self._record_history({'context_type': 'environment', 'environment': dict(env_data)})
+        self._state_version += 1
+        
+    def _accumulate_environment(self, env_data: Dict[str, Any], delta: np.ndarray) -> float:
+        """
+        Add the emotion changes caused by environmental factors to delta.
+        
+        Returns:
+            The change to the overall intensity, for the caller to apply
+        """
+        intensity_delta = 0.0
+        for factor, (low, high, deltas) in self._ENV_TABLES.items():
+            if factor in env_data:
+                value = env_data[factor]
+                # Row 0 below low, 1 in range, 2 above high
+                row = deltas[(value >= low) + (value > high)]
+                delta += row[:-1]
+                intensity_delta += float(row[-1])
+        return intensity_delta
+        
+    def _adjust_intensity(self, amount: float) -> None:
+        """Adjust the overall emotional intensity, kept between 0 and 1."""
+        intensity = self.emotional_state['intensity'] + amount
+        self.emotional_state['intensity'] = max(0.0, min(1.0, intensity))
+        
+    def get_current_state(self) -> MappingProxyType:
+        """Get the current emotional state as a cached read-only view."""
+        if self._cached_current_version != self._state_version:
+            # Find the primary emotion (highest value)
+            primary_emotion = self.EMOTION_NAMES[int(self._vec.argmax())]
             
-        # Decay emotions slightly towards neutral
-        for emotion in self.emotional_state['emotions']:
-            if emotion not in ['intensity', 'primary_emotion']:
-                self.emotional_state['emotions'][emotion] *= 0.95  # Slight decay
-                
+            self._cached_current_view = MappingProxyType({
+                'emotions': MappingProxyType(dict(zip(self.EMOTION_NAMES, self._vec.tolist()))),
+                'primary_emotion': primary_emotion,
+                'personality': self.emotional_state['personality']
+            })
+            self._cached_current_version = self._state_version
+        return self._cached_current_view
+        
+    def _record_history(self, context: Dict[str, Any], text: Optional[str] = None) -> None:
+        """Store the current emotion vector, input text and context in the history."""
+        i = self._hist_idx
+        self.emotion_history[i] = self._vec
+        self._hist_ts[i] = time.time()
+        self._hist_text[i] = text
+        self._hist_idx = (i + 1) % self.HISTORY_CAP
+        if self._hist_idx == 0:
+            self._hist_full = True
+        self.context_history.append(context)
+        
+    def _history_order(self) -> np.ndarray:
+        """Ring buffer indices of the stored history, oldest first."""
+        if not self._hist_full:
+            return np.arange(self._hist_idx)
+        return np.roll(np.arange(self.HISTORY_CAP), -self._hist_idx)
+        
+    def get_history_vectors(self) -> np.ndarray:
+        """
+        Get the history of emotion vectors.
+        
+        Returns:
+            Array of shape (n, len(EMOTION_NAMES)), oldest state first
+        """
+        return self.emotion_history[self._history_order()]
+        
     def get_emotional_history(self) -> List[Dict[str, Any]]:
-        """Get the history of emotional states."""
-        return self.history 
\ No newline at end of file
+        """Get the history of emotional states, oldest first."""
+        order = self._history_order()
+        vectors = self.emotion_history[order].tolist()
+        timestamps = self._hist_ts[order].tolist()
+        return [
+            {
+                'timestamp': timestamp,
+                'input': self._hist_text[i],
+                'emotions': dict(zip(self.EMOTION_NAMES, vector))
+            }
+            for i, timestamp, vector in zip(order.tolist(), timestamps, vectors)
+        ]
@@ -1,53 +1,166 @@
 """
 System for defining and managing complex emotional states and their relationships.
 """
-from typing import Dict, List, Optional, Tuple, Any
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from itertools import groupby
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Any
 import numpy as np
 
+from ._emotion_kernels import DTYPE as _DTYPE, HAVE_NUMBA, classify
+
+# Emotional transition patterns between complex states
+_TRANSITIONS_BASE = {
+    'nostalgic': ('contemplative', 'sadness', 'joy', 'reflective'),
+    'determined': ('playful', 'contemplative', 'anger', 'inspired'),
+    'playful': ('joy', 'curious', 'trust', 'optimistic'),
+    'caring': ('joy', 'trust', 'contemplative', 'grateful'),
+    'inspired': ('optimistic', 'determined', 'joy', 'playful'),
+    'grateful': ('joy', 'trust', 'caring', 'optimistic'),
+    'optimistic': ('joy', 'inspired', 'anticipation', 'playful'),
+    'anxious': ('fear', 'contemplative', 'trust', 'overwhelmed'),
+    'frustrated': ('anger', 'contemplative', 'determined', 'disappointed'),
+    'lonely': ('sadness', 'anxious', 'caring', 'melancholic'),
+    'overwhelmed': ('anxious', 'fear', 'contemplative', 'reflective'),
+    'disappointed': ('sadness', 'frustrated', 'contemplative', 'melancholic'),
+    'jealous': ('anger', 'disgust', 'frustrated', 'anxious'),
+    'contemplative': ('curious', 'determined', 'nostalgic', 'reflective'),
+    'curious': ('playful', 'contemplative', 'determined', 'inspired'),
+    'reflective': ('contemplative', 'mindful', 'nostalgic', 'melancholic'),
+    'mindful': ('contemplative', 'reflective', 'trust', 'calm'),
+    'bittersweet': ('nostalgic', 'melancholic', 'joy', 'sadness'),
+    'melancholic': ('sadness', 'contemplative', 'nostalgic', 'reflective')
+}
+
+# High empathy adds more emotional transitions and caring states
+_TRANSITIONS_HIGH_EMPATHY = {
+    k: v + ('caring', 'trust', 'grateful') for k, v in _TRANSITIONS_BASE.items()
+}
+
+# Low empathy reduces transitions and focuses on basic emotions
+_TRANSITIONS_LOW_EMPATHY = {
+    k: v[:2] for k, v in _TRANSITIONS_BASE.items()
+}
+
+_TRANSITIONS_BY_PERSONALITY = {
+    'high_empathy': _TRANSITIONS_HIGH_EMPATHY,
+    'low_empathy': _TRANSITIONS_LOW_EMPATHY
+}
+
 class EmotionalState:
+    # Core emotions (Plutchik's wheel of emotions) plus state dimensions,
+    # in the fixed order used by the state vector (interned, so names taken
+    # from it are shared singletons)
+    EMOTION_NAMES = tuple(sys.intern(name) for name in (
+        'joy',
+        'trust',
+        'fear',
+        'surprise',
+        'sadness',
+        'disgust',
+        'anger',
+        'anticipation',
+        'energy',
+        'focus',
+        'stress',
+        'social_comfort'
+    ))
+    EMOTION_INDEX = {name: i for i, name in enumerate(EMOTION_NAMES)}
+    
     def __init__(self):
         """Initialize emotional state with basic emotions."""
-        # Core emotions (Plutchik's wheel of emotions)
-        self.emotions = {
-            'joy': 0.0,
-            'trust': 0.0,
-            'fear': 0.0,
-            'surprise': 0.0,
-            'sadness': 0.0,
-            'disgust': 0.0,
-            'anger': 0.0,
-            'anticipation': 0.0,
-            'energy': 0.0,
-            'focus': 0.0,
-            'stress': 0.0,
-            'social_comfort': 0.0
-        }
+        self._vec = np.zeros(len(self.EMOTION_NAMES), dtype=_DTYPE)
         self.intensity = 0.5  # Overall emotional intensity
         
+        # Read-only dict view of _vec, rebuilt only after the vector changes
+        self._version = 0
+        self._cached_version = -1
+        self._cached_view = None
+        
     def adjust_emotion(self, emotion: str, amount: float) -> None:
         """Adjust the intensity of an emotion."""
-        if emotion in self.emotions:
-            self.emotions[emotion] = max(0.0, min(1.0, self.emotions[emotion] + amount))
+        i = self.EMOTION_INDEX.get(emotion)
+        if i is None:
+            return
+        value = self._vec[i] + amount
+        if value > 1.0:
+            value = 1.0
+        elif value < 0.0:
+            value = 0.0
+        self._vec[i] = value
+        self._version += 1
+        
+    def adjust_emotions(self, delta: np.ndarray) -> None:
+        """
+        Adjust every emotion at once, clamping to [0, 1].
+        
+        Args:
+            delta: Array of changes in EMOTION_NAMES order
+        """
+        self._vec += delta
+        np.clip(self._vec, 0.0, 1.0, out=self._vec)
+        self._version += 1
             
     def normalize(self) -> None:
         """Normalize emotional intensities."""
-        # Calculate the maximum value
-        max_value = max(self.emotions.values())
+        # Scale so the strongest emotion is 1
+        max_value = self._vec.max()
         if max_value > 0:
-            # Normalize all emotions
-            for emotion in self.emotions:
-                self.emotions[emotion] /= max_value
+            self._vec /= max_value
+            self._version += 1
                 
         # Update overall intensity
-        self.intensity = np.mean(list(self.emotions.values()))
+        self.intensity = float(self._vec.mean())
+        
+    def get_vector(self) -> MappingProxyType:
+        """
+        Get the current emotional state as a vector.
+        
+        Returns a read-only view that is shared between calls until the
+        state changes. Use get_vector_copy() for a mutable snapshot.
+        """
+        if self._cached_version != self._version:
+            self._cached_view = MappingProxyType(dict(zip(self.EMOTION_NAMES, self._vec.tolist())))
+            self._cached_version = self._version
+        return self._cached_view
         
-    def get_vector(self) -> Dict[str, float]:
-        """Get the current emotional state as a vector."""
-        return self.emotions.copy()
+    def get_vector_copy(self) -> Dict[str, float]:
+        """Get a mutable copy of the current emotional state."""
+        return dict(zip(self.EMOTION_NAMES, self._vec.tolist()))
         
-    def get_emotions(self) -> Dict[str, float]:
+    def get_emotions(self) -> MappingProxyType:
         """Get the current emotional state."""
-        return self.emotions.copy()
+        return self.get_vector()
+
+@dataclass(frozen=True)
+class ComplexState:
+    """A complex emotional state as rows of the dense scoring matrices."""
+    __slots__ = ('name', 'target', 'mask', 'count')
+    name: str
+    target: np.ndarray
+    mask: np.ndarray
+    count: int
+
+@dataclass(frozen=True)
+class PersonalityType:
+    """Per-emotion response weights, thresholds and sensitivities of a personality type."""
+    __slots__ = ('name', 'weight', 'threshold', 'sensitivity')
+    name: str
+    weight: np.ndarray
+    threshold: np.ndarray
+    sensitivity: np.ndarray
+
+# Batches at least this large are scored with NumPy broadcasting; smaller
+# ones go through the Numba kernel when it is available
+_NUMPY_BATCH_MIN = 32
+
+# Vector positions of the emotions get_emotional_response writes directly
+_IDX_JOY = EmotionalState.EMOTION_INDEX['joy']
+_IDX_ENERGY = EmotionalState.EMOTION_INDEX['energy']
+_IDX_FOCUS = EmotionalState.EMOTION_INDEX['focus']
+_IDX_STRESS = EmotionalState.EMOTION_INDEX['stress']
 
 class ComplexEmotionalSystem:
     def __init__(self):
@@ -128,26 +241,115 @@ class ComplexEmotionalSystem:
             }
         }
         
-    def get_complex_state(self, emotional_state: EmotionalState) -> Tuple[str, float]:
-        """Calculate the most likely complex emotional state."""
-        emotions = emotional_state.get_vector()
-        best_state = 'contemplative'
-        best_confidence = 0.0
+        # Dense per-emotion parameters parsed from the '<emotion>_weight',
+        # '<emotion>_threshold' and '<emotion>_sensitivity' entries of each type
+        n_emotions = len(EmotionalState.EMOTION_NAMES)
+        self._personalities = {}
+        for ptype, params in self.personality_types.items():
+            weight = np.ones(n_emotions, dtype=_DTYPE)
+            thresh = np.full(n_emotions, 0.5, dtype=_DTYPE)
+            sensitivity = np.ones(n_emotions, dtype=_DTYPE)
+            for key, value in params.items():
+                emotion, _, kind = key.rpartition('_')
+                i = EmotionalState.EMOTION_INDEX.get(emotion)
+                if i is None:
+                    continue
+                if kind == 'weight':
+                    weight[i] = value
+                elif kind == 'threshold':
+                    thresh[i] = value
+                elif kind == 'sensitivity':
+                    sensitivity[i] = value
+            self._personalities[ptype] = PersonalityType(ptype, weight, thresh, sensitivity)
+        
+        # Learned counts keyed by (context value, complex state)
+        self.emotional_learning = {
+            'state_transitions': Counter(),
+            'context_patterns': Counter(),
+            'user_interactions': Counter()
+        }
         
-        for state, state_emotions in self.complex_states.items():
-            confidence = 0.0
+        # Dense form of complex_states for vectorized scoring: target values,
+        # which emotions each state specifies, and how many
+        n_states = len(self.complex_states)
+        self._targets = np.zeros((n_states, n_emotions), dtype=_DTYPE)
+        self._mask = np.zeros((n_states, n_emotions), dtype=bool)
+        for row, state_emotions in enumerate(self.complex_states.values()):
             for emotion, target_value in state_emotions.items():
-                if emotion in emotions:
-                    # Calculate similarity between current and target emotion
-                    diff = abs(emotions[emotion] - target_value)
-                    confidence += 1 - diff
-                    
-            confidence /= len(state_emotions)
-            if confidence > best_confidence:
-                best_confidence = confidence
-                best_state = state
-                
-        return best_state, best_confidence
+                col = EmotionalState.EMOTION_INDEX[emotion]
+                self._targets[row, col] = target_value
+                self._mask[row, col] = True
+        self._counts = self._mask.sum(axis=1).astype(np.int32)
+        self._states = tuple(
+            ComplexState(name, self._targets[row], self._mask[row], int(self._counts[row]))
+            for row, name in enumerate(self.complex_states)
+        )
+        
+        # Reusable (batch, state, emotion) buffer for classify_batch
+        self._scratch = np.empty((0, n_states, n_emotions), dtype=_DTYPE)
+        
+    def get_complex_state(self, emotional_state: EmotionalState, _abs=np.abs) -> Tuple[str, float]:
+        """Calculate the most likely complex emotional state."""
+        # Similarity to each state's targets, averaged over the emotions it specifies
+        confidence = ((1 - _abs(self._targets - emotional_state._vec)) * self._mask).sum(axis=1) / self._counts
+        idx = int(confidence.argmax())
+        
+        if confidence[idx] <= 0:
+            return 'contemplative', 0.0
+        return self._states[idx].name, float(confidence[idx])
+        
+    def get_complex_state_batch(self, vecs: np.ndarray) -> Tuple[List[str], np.ndarray]:
+        """
+        Classify many emotion vectors at once.
+        
+        Args:
+            vecs: float32 array of shape (n, len(EmotionalState.EMOTION_NAMES))
+            
+        Returns:
+            List of complex state names and an array of their confidences
+        """
+        vecs = np.ascontiguousarray(vecs, dtype=_DTYPE)
+        idx, conf = self.classify_batch(vecs)
+        
+        names = [self._states[i].name if i >= 0 else 'contemplative' for i in idx.tolist()]
+        return names, conf
+        
+    def classify_batch(self, vecs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score many emotion vectors against every complex state.
+        
+        Args:
+            vecs: C-contiguous float32 array of shape (n, len(EmotionalState.EMOTION_NAMES))
+            
+        Returns:
+            Array of best state indices (-1 where no state scores above 0)
+            and an array of their confidences
+        """
+        n = len(vecs)
+        if HAVE_NUMBA and n < _NUMPY_BATCH_MIN:
+            idx = np.empty(n, dtype=np.int32)
+            conf = np.empty(n, dtype=_DTYPE)
+            classify(self._targets, self._mask, self._counts, vecs, idx, conf)
+            return idx, conf
+            
+        if len(self._scratch) < n:
+            self._scratch = np.empty((n,) + self._targets.shape, dtype=_DTYPE)
+        diff = self._scratch[:n]
+        
+        # 1 - |target - value| over each state's specified emotions, averaged
+        np.subtract(self._targets, vecs[:, None, :], out=diff)
+        np.abs(diff, out=diff)
+        np.subtract(1, diff, out=diff)
+        diff *= self._mask
+        scores = diff.sum(axis=2)
+        scores /= self._counts
+        
+        idx = scores.argmax(axis=1).astype(np.int32)
+        conf = scores[np.arange(n), idx]
+        unmatched = conf <= 0
+        idx[unmatched] = -1
+        conf[unmatched] = 0
+        return idx, conf
         
     def adjust_emotional_thresholds(self, personality_type: str) -> Dict[str, float]:
         """Adjust emotional thresholds based on personality type."""
@@ -157,40 +359,33 @@ class ComplexEmotionalSystem:
         
     def get_emotional_response(self, current_state: str, personality_type: str, context: Dict[str, Any]) -> Dict[str, float]:
         """Generate emotional response based on current state and context."""
-        # Get personality-based thresholds
-        thresholds = self.adjust_emotional_thresholds(personality_type)
-        
-        # Initialize response
-        response = {}
+        response = np.zeros(len(EmotionalState.EMOTION_NAMES), dtype=_DTYPE)
         
         # Process context-specific responses
         if 'user_emotion' in context:
-            user_emotion = context['user_emotion']
             # Empathize with user emotion
-            for emotion, intensity in user_emotion.items():
-                response[emotion] = intensity * 0.5
+            for emotion, intensity in context['user_emotion'].items():
+                i = EmotionalState.EMOTION_INDEX.get(sys.intern(emotion))
+                if i is not None:
+                    response[i] = intensity * 0.5
                 
         if 'environment' in context:
             env = context['environment']
             # Adjust response based on environmental factors
             if 'brightness' in env:
-                response['joy'] = env['brightness'] * 0.3
-                response['energy'] = env['brightness'] * 0.2
+                response[_IDX_JOY] = env['brightness'] * 0.3
+                response[_IDX_ENERGY] = env['brightness'] * 0.2
                 
             if 'noise_level' in env:
-                response['stress'] = env['noise_level'] * 0.4
-                response['focus'] = (1 - env['noise_level']) * 0.3
+                response[_IDX_STRESS] = env['noise_level'] * 0.4
+                response[_IDX_FOCUS] = (1 - env['noise_level']) * 0.3
                 
-        # Apply personality-based adjustments
-        for emotion, value in response.items():
-            if emotion in thresholds:
-                threshold = thresholds.get(f'{emotion}_threshold', 0.5)
-                weight = thresholds.get(f'{emotion}_weight', 1.0)
-                response[emotion] = value * weight
+        # Apply personality-based weights
+        response *= self._personalities.get(personality_type, self._personalities['balanced']).weight
                 
-        return response
+        return dict(zip(EmotionalState.EMOTION_NAMES, response.tolist()))
         
-    def get_emotional_chain(self, current_state: str, personality_type: str) -> List[str]:
+    def get_emotional_chain(self, current_state: str, personality_type: str) -> Tuple[str, ...]:
         """
         Get likely emotional transitions based on current state and personality.
         
@@ -199,44 +394,9 @@ class ComplexEmotionalSystem:
             personality_type: Type of personality
             
         Returns:
-            List of likely next emotional states
+            Tuple of likely next emotional states
         """
-        # Define emotional transition patterns
-        transitions = {
-            'nostalgic': ['contemplative', 'sadness', 'joy', 'reflective'],
-            'determined': ['playful', 'contemplative', 'anger', 'inspired'],
-            'playful': ['joy', 'curious', 'trust', 'optimistic'],
-            'caring': ['joy', 'trust', 'contemplative', 'grateful'],
-            'inspired': ['optimistic', 'determined', 'joy', 'playful'],
-            'grateful': ['joy', 'trust', 'caring', 'optimistic'],
-            'optimistic': ['joy', 'inspired', 'anticipation', 'playful'],
-            'anxious': ['fear', 'contemplative', 'trust', 'overwhelmed'],
-            'frustrated': ['anger', 'contemplative', 'determined', 'disappointed'],
-            'lonely': ['sadness', 'anxious', 'caring', 'melancholic'],
-            'overwhelmed': ['anxious', 'fear', 'contemplative', 'reflective'],
-            'disappointed': ['sadness', 'frustrated', 'contemplative', 'melancholic'],
-            'jealous': ['anger', 'disgust', 'frustrated', 'anxious'],
-            'contemplative': ['curious', 'determined', 'nostalgic', 'reflective'],
-            'curious': ['playful', 'contemplative', 'determined', 'inspired'],
-            'reflective': ['contemplative', 'mindful', 'nostalgic', 'melancholic'],
-            'mindful': ['contemplative', 'reflective', 'trust', 'calm'],
-            'bittersweet': ['nostalgic', 'melancholic', 'joy', 'sadness'],
-            'melancholic': ['sadness', 'contemplative', 'nostalgic', 'reflective']
-        }
-        
-        # Adjust transitions based on personality
-        if personality_type == 'high_empathy':
-            # Add more emotional transitions and caring states
-            transitions = {
-                k: v + ['caring', 'trust', 'grateful'] for k, v in transitions.items()
-            }
-        elif personality_type == 'low_empathy':
-            # Reduce emotional transitions and focus on basic emotions
-            transitions = {
-                k: v[:2] for k, v in transitions.items()
-            }
-            
-        return transitions.get(current_state, [])
+        return _TRANSITIONS_BY_PERSONALITY.get(personality_type, _TRANSITIONS_BASE).get(current_state, ())
         
     def _update_emotional_learning(self, current_state: str, context: Dict[str, Any]) -> None:
         """
@@ -246,29 +406,32 @@ class ComplexEmotionalSystem:
             current_state: Current complex emotional state
             context: Current context information
         """
+        learning = self.emotional_learning
+        
         # Track state transitions
         if 'previous_state' in context:
-            prev_state = context['previous_state']
-            if prev_state not in self.emotional_learning['state_transitions']:
-                self.emotional_learning['state_transitions'][prev_state] = {}
-            if current_state not in self.emotional_learning['state_transitions'][prev_state]:
-                self.emotional_learning['state_transitions'][prev_state][current_state] = 0
-            self.emotional_learning['state_transitions'][prev_state][current_state] += 1
+            learning['state_transitions'][(context['previous_state'], current_state)] += 1
             
         # Track context patterns
         if 'context_type' in context:
-            context_type = context['context_type']
-            if context_type not in self.emotional_learning['context_patterns']:
-                self.emotional_learning['context_patterns'][context_type] = {}
-            if current_state not in self.emotional_learning['context_patterns'][context_type]:
-                self.emotional_learning['context_patterns'][context_type][current_state] = 0
-            self.emotional_learning['context_patterns'][context_type][current_state] += 1
+            learning['context_patterns'][(context['context_type'], current_state)] += 1
             
         # Track user interactions
         if 'user_interaction' in context:
-            interaction = context['user_interaction']
-            if interaction not in self.emotional_learning['user_interactions']:
-                self.emotional_learning['user_interactions'][interaction] = {}
-            if current_state not in self.emotional_learning['user_interactions'][interaction]:
-                self.emotional_learning['user_interactions'][interaction][current_state] = 0
-            self.emotional_learning['user_interactions'][interaction][current_state] += 1 
\ No newline at end of file
+            learning['user_interactions'][(context['user_interaction'], current_state)] += 1
+            
+    def get_learning_patterns(self, category: str) -> Dict[str, Dict[str, int]]:
+        """
+        Get learned counts for one category as a nested dictionary.
+        
+        Args:
+            category: 'state_transitions', 'context_patterns' or 'user_interactions'
+            
+        Returns:
+            Mapping of outer key to {complex state: count}
+        """
+        counts = self.emotional_learning[category]
+        return {
+            outer: {state: n for (_, state), n in group}
+            for outer, group in groupby(sorted(counts.items()), key=lambda item: item[0][0])
+        }
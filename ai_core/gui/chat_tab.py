@@ -4,9 +4,15 @@ Chat interface tab for the AI Companion application.
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import logging
+import queue
+import re
+import threading
 
 from ai_core.gui.command_processor import CommandProcessor
 
+# Splits "/command args..." into the command name and the rest in one match
+COMMAND_RE = re.compile(r'/\s*(\S*)\s*(.*)', re.DOTALL)
+
 class ChatTab:
     """
     Tab containing the chat interface for interacting with the AI.
@@ -19,6 +25,12 @@ class ChatTab:
         # Initialize command processor
         self.command_processor = CommandProcessor(main_window)
         
+        # Chat logs are written by a background thread so disk I/O
+        # never blocks the Tk event loop
+        self._save_queue = queue.SimpleQueue()
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
+        
         self._create_widgets()
         
         # Ensure the widgets are packed correctly
@@ -72,7 +84,8 @@ class ChatTab:
             self.text_input.delete(0, tk.END)
             
             # Check if it's a command
-            if text.startswith('/') and self.command_processor.process_text(text):
+            match = COMMAND_RE.match(text)
+            if match and self.command_processor.dispatch(match.group(1).lower(), match.group(2)):
                 return
                 
             # Not a command, process as normal input
@@ -99,12 +112,39 @@ class ChatTab:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"chat_log_{timestamp}.txt"
             
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(self.chat_text.get(1.0, tk.END))
-                
-            self.main_window.add_message("System", f"Chat saved to '{filename}'", animate=False)
+        # Snapshot the text on the Tk thread, then hand it to the writer
+        self._save_queue.put((filename, self._snapshot_chat()))
+        
+    def _snapshot_chat(self, lines_per_chunk=1000):
+        """
+        Copy the chat text out of Tk in line-range chunks.
+        
+        Args:
+            lines_per_chunk: Number of text lines fetched per Tk call
             
-        except Exception as e:
-            self.logger.error(f"Error saving chat: {e}")
-            self.main_window.add_message("System", f"Error saving chat: {str(e)}", animate=False) 
\ No newline at end of file
+        Returns:
+            List of text chunks that together equal get(1.0, END)
+        """
+        last_line = int(self.chat_text.index('end-1c').split('.')[0])
+        return [
+            self.chat_text.get(f"{start}.0", f"{start + lines_per_chunk}.0")
+            for start in range(1, last_line + 1, lines_per_chunk)
+        ]
+        
+    def _save_worker(self):
+        """Write queued chat snapshots to disk in the background."""
+        while True:
+            filename, chunks = self._save_queue.get()
+            try:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.writelines(chunks)
+                    
+                message = f"Chat saved to '{filename}'"
+                
+            except Exception as e:
+                self.logger.error(f"Error saving chat: {e}")
+                message = f"Error saving chat: {str(e)}"
+                
+            # Report back on the Tk thread
+            self.main_window.root.after(
+                0, lambda m=message: self.main_window.add_message("System", m, animate=False))
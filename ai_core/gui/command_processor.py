@@ -1,8 +1,107 @@
 """
 Command processor for handling special commands in the chat.
 """
+import functools
 import logging
-import re
+
+# Help text shown by /help, built once at import
+_HELP_TEXT = "\n".join((
+    "Available commands:",
+    "  /help - Show this help message",
+    "  /mode [family|mature|adult] - Set content mode",
+    "  /voice [on|off] - Toggle voice output",
+    "  /vision [on|off] - Toggle vision system",
+    "  /clear - Clear chat history",
+    "  /save [filename] - Save chat to file",
+    "  /camera [list|reset] - Camera controls",
+    "  /personality [list|load name] - Personality controls",
+    "  /debug [on|off] - Toggle debug mode",
+    "  /image <prompt> - Generate an image",
+    "  /memory [clear|save|load] - Memory management",
+    "  /status - Show system status"
+))
+
+_UNKNOWN_COMMAND_SUFFIX = ". Type /help for available commands."
+
+# /status report layout; the optional sections are filled in or left empty
+_STATUS_TEMPLATE = (
+    "System Status:\n"
+    "Voice output: {voice_out}\n"
+    "Voice input: {voice_in}\n"
+    "Vision system: {vision}\n"
+    "{camera}{content_mode}{personality}"
+)
+_STATUS_CAMERA = "Camera status: {}\nFace detection: {}\n"
+_STATUS_CONTENT_MODE = "Content mode: {}\n"
+_STATUS_PERSONALITY = "Active personality: {}"
+
+@functools.lru_cache(maxsize=4)
+def _render_status(voice_out, voice_in, vision, camera, content_mode, personality):
+    """Render the /status report.
+    
+    Memoized on its arguments, so repeated /status calls with unchanged
+    state reuse the same string.
+    
+    Args:
+        voice_out: Whether voice output is enabled
+        voice_in: Whether voice input is enabled
+        vision: Whether the vision system is enabled
+        camera: (camera status, face detected) tuple, or None to omit
+        content_mode: Content mode name, or None to omit
+        personality: Active personality name, or None to omit
+        
+    Returns:
+        str: The status report
+    """
+    return _STATUS_TEMPLATE.format_map({
+        'voice_out': 'enabled' if voice_out else 'disabled',
+        'voice_in': 'enabled' if voice_in else 'disabled',
+        'vision': 'enabled' if vision else 'disabled',
+        'camera': _STATUS_CAMERA.format(camera[0], 'active' if camera[1] else 'inactive') if camera else '',
+        'content_mode': _STATUS_CONTENT_MODE.format(content_mode) if content_mode is not None else '',
+        'personality': _STATUS_PERSONALITY.format(personality) if personality is not None else ''
+    })
+
+# Accepted spellings for on/off command arguments
+_ON_STATES = frozenset({"on", "enable", "true", "1", "yes"})
+_OFF_STATES = frozenset({"off", "disable", "false", "0", "no"})
+
+# Capability bits for main_window components, see refresh_capabilities()
+_CAP_PERSONALITY_TAB = 1 << 0
+_CAP_PERSONALITY_VARS = 1 << 1
+_CAP_VISION_TAB = 1 << 2
+_CAP_VISION_SYSTEM = 1 << 3
+_CAP_USE_VISION = 1 << 4
+_CAP_LLM = 1 << 5
+_CAP_CONTENT_MODE = 1 << 6
+_CAP_PERSONALITY_SETTINGS = 1 << 7
+_CAP_MEMORY = 1 << 8
+
+def _parse_bool(state):
+    """Parse an on/off state.
+    
+    Args:
+        state: Lower-case argument token
+        
+    Returns:
+        True or False for a recognised state, None otherwise
+    """
+    if state in _ON_STATES:
+        return True
+    if state in _OFF_STATES:
+        return False
+    return None
+
+def _format_conversation_list(files):
+    """Format saved conversation names as one multi-line message.
+    
+    Args:
+        files: Saved conversation file names
+        
+    Returns:
+        str: Header line followed by one "- name" line per file
+    """
+    return "Available saved conversations:\n" + "\n".join("- " + f for f in files)
 
 class CommandProcessor:
     """Process text commands in chat"""
@@ -33,54 +132,73 @@ class CommandProcessor:
             "memory": self._cmd_memory
         }
         
-    def process_text(self, text):
-        """Check if text is a command and process accordingly.
+        # Age verification checkbox variable, resolved on first /mode adult
+        self._age_verified_var = None
         
-        Args:
-            text: The text input to check and process
-            
-        Returns:
-            bool: True if text was a command and was processed, False otherwise
+        # Which main_window components exist, probed once
+        self._caps = 0
+        self.refresh_capabilities()
+        
+    def refresh_capabilities(self):
+        """Probe which main_window components are available.
+        
+        Handlers check the cached bits instead of calling hasattr on every
+        command. Call this again if components are added or replaced.
         """
-        if not text.startswith(self.command_prefix):
-            return False
-            
-        # Extract command without prefix
-        command_text = text[len(self.command_prefix):].strip()
-        return self.handle_command(command_text)
-            
-    def handle_command(self, command_text):
-        """Process command text.
+        mw = self.main_window
+        caps = 0
+        if hasattr(mw, 'personality_tab'):
+            caps |= _CAP_PERSONALITY_TAB
+            if hasattr(mw.personality_tab, '_personality_vars'):
+                caps |= _CAP_PERSONALITY_VARS
+        if hasattr(mw, 'vision_tab'):
+            caps |= _CAP_VISION_TAB
+        if hasattr(mw, 'vision_system'):
+            caps |= _CAP_VISION_SYSTEM
+        if hasattr(mw, 'use_vision'):
+            caps |= _CAP_USE_VISION
+        if hasattr(mw, 'llm'):
+            caps |= _CAP_LLM
+            if hasattr(mw.llm, 'get_content_mode'):
+                caps |= _CAP_CONTENT_MODE
+        if hasattr(mw, 'personality_settings'):
+            caps |= _CAP_PERSONALITY_SETTINGS
+        if hasattr(mw, 'memory_manager'):
+            caps |= _CAP_MEMORY
+        self._caps = caps
+        
+    def dispatch(self, cmd, rest):
+        """Run a parsed command.
         
         Args:
-            command_text: Command text without the prefix
+            cmd: Lower-case command name without the prefix
+            rest: Argument text after the command name; surrounding
+                whitespace is ignored
             
         Returns:
             bool: True if command was handled, False otherwise
         """
-        # Split into command and arguments
-        parts = command_text.split()
-        if not parts:
+        rest = rest.strip()
+        if not cmd:
             self._show_help("No command specified")
             return True
             
-        cmd = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
-        
         # Check if command exists
-        if cmd in self.commands:
-            try:
-                # Call the appropriate command handler
-                self.commands[cmd](args)
-                return True
-            except Exception as e:
-                self.logger.error(f"Error processing command '{cmd}': {e}")
-                self.main_window.add_message("System", f"Error processing command: {str(e)}", animate=False)
-                return True
-        else:
+        handler = self.commands.get(cmd)
+        if handler is None:
             self._show_unknown_command(cmd)
             return True
             
+        try:
+            # Call the appropriate command handler with the lower-cased
+            # subcommand (None if there are no arguments) and the raw text
+            sub = rest.split(None, 1)[0].lower() if rest else None
+            handler(sub, rest)
+        except Exception as e:
+            self.logger.error(f"Error processing command '{cmd}': {e}")
+            self.main_window.add_message("System", f"Error processing command: {str(e)}", animate=False)
+        return True
+            
     def _show_help(self, message=None):
         """Show help information.
         
@@ -90,22 +208,7 @@ class CommandProcessor:
         if message:
             self.main_window.add_message("System", message, animate=False)
             
-        # Show available commands
-        help_text = "Available commands:\n"
-        help_text += "  /help - Show this help message\n"
-        help_text += "  /mode [family|mature|adult] - Set content mode\n"
-        help_text += "  /voice [on|off] - Toggle voice output\n"
-        help_text += "  /vision [on|off] - Toggle vision system\n"
-        help_text += "  /clear - Clear chat history\n"
-        help_text += "  /save [filename] - Save chat to file\n"
-        help_text += "  /camera [list|reset] - Camera controls\n"
-        help_text += "  /personality [list|load name] - Personality controls\n"
-        help_text += "  /debug [on|off] - Toggle debug mode\n"
-        help_text += "  /image <prompt> - Generate an image\n"
-        help_text += "  /memory [clear|save|load] - Memory management\n"
-        help_text += "  /status - Show system status"
-        
-        self.main_window.add_message("System", help_text, animate=False)
+        self.main_window.add_message("System", _HELP_TEXT, animate=False)
     
     def _show_unknown_command(self, cmd):
         """Show message for unknown command.
@@ -113,23 +216,47 @@ class CommandProcessor:
         Args:
             cmd: The unknown command
         """
-        self.main_window.add_message("System", f"Unknown command: '{cmd}'. Type /help for available commands.", animate=False)
+        self.main_window.add_message("System", f"Unknown command: '{cmd}'{_UNKNOWN_COMMAND_SUFFIX}", animate=False)
+        
+    def _handle_toggle(self, sub, getter, setter, name, label=None):
+        """Toggle an on/off setting, or set it from an explicit argument.
+        
+        Args:
+            sub: Lower-case first argument, or None to toggle
+            getter: Returns the current state
+            setter: Applies the new state
+            name: Setting name used in the invalid-argument message
+            label: If given, report "<label> enabled/disabled" afterwards
+        """
+        if sub is None:
+            state = not getter()
+        else:
+            state = _parse_bool(sub)
+            if state is None:
+                self.main_window.add_message("System", f"Invalid {name} state: {sub}. Use 'on' or 'off'.", animate=False)
+                return
+                
+        setter(state)
+        if label:
+            self.main_window.add_message("System", f"{label} {'enabled' if state else 'disabled'}", animate=False)
         
-    def _cmd_help(self, args):
+    def _cmd_help(self, sub, rest):
         """Handle help command.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
         self._show_help()
         
-    def _cmd_mode(self, args):
+    def _cmd_mode(self, sub, rest):
         """Handle mode command for setting content mode.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        if not args:
+        if sub is None:
             # Show current mode
             current_mode = self.main_window.llm.get_content_mode()
             self.main_window.add_message("System", f"Current content mode: {current_mode}", animate=False)
@@ -137,7 +264,7 @@ class CommandProcessor:
             return
             
         # Set mode
-        mode = args[0].lower()
+        mode = sub
         if mode in ["family", "mature", "adult"]:
             # If adult mode, verify age
             if mode == "adult" and not self._verify_adult_mode():
@@ -152,88 +279,81 @@ class CommandProcessor:
     def _verify_adult_mode(self):
         """Verify that adult mode can be enabled."""
         # Check if age verification is already done in personality settings
-        if hasattr(self.main_window, 'personality_tab') and hasattr(self.main_window.personality_tab, '_personality_vars'):
-            vars = self.main_window.personality_tab._personality_vars
-            if 'age_verified' in vars and vars['age_verified'].get():
-                return True
+        if self._age_verified_var is None and self._caps & _CAP_PERSONALITY_VARS:
+            self._age_verified_var = self.main_window.personality_tab._personality_vars.get('age_verified')
+        if self._age_verified_var is not None and self._age_verified_var.get():
+            return True
                 
         # Otherwise, warn the user
         self.main_window.add_message("System", "Adult mode requires age verification. Please go to Personality > Preferences > Content Level and check the age verification box.", animate=False)
         return False
             
-    def _cmd_voice(self, args):
+    def _cmd_voice(self, sub, rest):
         """Handle voice command for controlling voice output.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        if not args:
-            # Toggle voice
+        mw = self.main_window
+        self._handle_toggle(sub, lambda: mw.use_voice_output, self._set_voice_output, "voice", "Voice output")
+        
+    def _set_voice_output(self, enabled):
+        """Switch voice output through the main window so its status bar follows."""
+        if enabled != self.main_window.use_voice_output:
             self.main_window._toggle_output_mode()
-            status = "enabled" if self.main_window.use_voice_output else "disabled"
-            self.main_window.add_message("System", f"Voice output {status}", animate=False)
-            return
-            
-        # Set voice state
-        state = args[0].lower()
-        if state in ["on", "enable", "true", "1", "yes"]:
-            self.main_window.use_voice_output = True
-            self.main_window.add_message("System", "Voice output enabled", animate=False)
-        elif state in ["off", "disable", "false", "0", "no"]:
-            self.main_window.use_voice_output = False
-            self.main_window.add_message("System", "Voice output disabled", animate=False)
-        else:
-            self.main_window.add_message("System", f"Invalid voice state: {state}. Use 'on' or 'off'.", animate=False)
             
-    def _cmd_vision(self, args):
+    def _cmd_vision(self, sub, rest):
         """Handle vision command for controlling vision system.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        if not args:
-            # Toggle vision
+        mw = self.main_window
+        self._handle_toggle(sub, lambda: mw.use_vision, self._set_vision, "vision")
+        
+    def _set_vision(self, enabled):
+        """Start or stop the vision system if it is not already in that state."""
+        if enabled != self.main_window.use_vision:
             self.main_window.vision_tab.toggle_vision()
-            return
             
-        # Set vision state
-        state = args[0].lower()
-        if state in ["on", "enable", "true", "1", "yes"]:
-            if not self.main_window.use_vision:
-                self.main_window.vision_tab.toggle_vision()
-        elif state in ["off", "disable", "false", "0", "no"]:
-            if self.main_window.use_vision:
-                self.main_window.vision_tab.toggle_vision()
-        else:
-            self.main_window.add_message("System", f"Invalid vision state: {state}. Use 'on' or 'off'.", animate=False)
-            
-    def _cmd_clear(self, args):
+    def _cmd_clear(self, sub, rest):
         """Handle clear command for clearing chat.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
         self.main_window.chat_tab.clear_chat()
         
-    def _cmd_save(self, args):
+    def _cmd_save(self, sub, rest):
         """Handle save command for saving chat.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        filename = args[0] if args else None
+        filename = rest.split(None, 1)[0] if sub is not None else None
         self.main_window.chat_tab.save_chat(filename)
         
-    def _cmd_camera(self, args):
+    def _cmd_camera(self, sub, rest):
         """Handle camera command for camera controls.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        if not args:
+        if not self._caps & _CAP_VISION_TAB:
+            self.main_window.add_message("System", "Vision system not initialized", animate=False)
+            return
+        vision_tab = self.main_window.vision_tab
+        
+        if sub is None:
             # Show camera status
-            if hasattr(self.main_window, 'vision_system') and self.main_window.vision_system:
-                status = self.main_window.vision_system.get_vision_info()
+            vision_system = self.main_window.vision_system if self._caps & _CAP_VISION_SYSTEM else None
+            if vision_system:
+                status = vision_system.get_vision_info()
                 self.main_window.add_message("System", f"Camera status: {status}", animate=False)
             else:
                 self.main_window.add_message("System", "Vision system not initialized", animate=False)
@@ -241,23 +361,23 @@ class CommandProcessor:
             return
             
         # Handle camera subcommands
-        subcmd = args[0].lower()
-        if subcmd == "list":
-            self.main_window.vision_tab._list_cameras()
-        elif subcmd == "reset" or subcmd == "recover":
-            self.main_window.vision_tab._attempt_camera_recovery()
+        if sub == "list":
+            vision_tab._list_cameras()
+        elif sub == "reset" or sub == "recover":
+            vision_tab._attempt_camera_recovery()
         else:
-            self.main_window.add_message("System", f"Invalid camera command: {subcmd}. Use 'list' or 'reset'.", animate=False)
+            self.main_window.add_message("System", f"Invalid camera command: {sub}. Use 'list' or 'reset'.", animate=False)
             
-    def _cmd_personality(self, args):
+    def _cmd_personality(self, sub, rest):
         """Handle personality command for personality controls.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        if not args:
+        if sub is None:
             # Show current personality settings
-            if hasattr(self.main_window, 'personality_tab'):
+            if self._caps & _CAP_PERSONALITY_TAB:
                 settings = self.main_window.personality_settings
                 name = settings.get('name', 'Default')
                 personality_type = settings.get('personality_type', 'None')
@@ -273,62 +393,48 @@ class CommandProcessor:
             return
             
         # Handle personality subcommands
-        subcmd = args[0].lower()
-        if subcmd == "list":
+        args = rest.split()
+        if sub == "list":
             # This would list available saved personalities
             self.main_window.add_message("System", "Saved personalities not yet implemented", animate=False)
-        elif subcmd == "load" and len(args) > 1:
+        elif sub == "load" and len(args) > 1:
             # This would load a saved personality
             personality_name = args[1]
             self.main_window.add_message("System", f"Loading personality '{personality_name}' not yet implemented", animate=False)
         else:
             self.main_window.add_message("System", "Usage: /personality [list|load name]", animate=False)
             
-    def _cmd_debug(self, args):
+    def _cmd_debug(self, sub, rest):
         """Handle debug command for toggling debug mode.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        if not args:
-            # Toggle debug mode
-            if hasattr(self.main_window, 'vision_tab'):
-                current = self.main_window.vision_tab.debug_var.get()
-                self.main_window.vision_tab.debug_var.set(not current)
-                self.main_window.vision_tab._toggle_debug()
-                status = "enabled" if not current else "disabled"
-                self.main_window.add_message("System", f"Debug mode {status}", animate=False)
-            else:
-                self.main_window.add_message("System", "Vision system not initialized", animate=False)
+        if not self._caps & _CAP_VISION_TAB:
+            self.main_window.add_message("System", "Vision system not initialized", animate=False)
             return
+        vision_tab = self.main_window.vision_tab
+        
+        def set_debug(enabled):
+            vision_tab.debug_var.set(enabled)
+            vision_tab._toggle_debug()
             
-        # Set debug state
-        state = args[0].lower()
-        if state in ["on", "enable", "true", "1", "yes"]:
-            if hasattr(self.main_window, 'vision_tab'):
-                self.main_window.vision_tab.debug_var.set(True)
-                self.main_window.vision_tab._toggle_debug()
-                self.main_window.add_message("System", "Debug mode enabled", animate=False)
-        elif state in ["off", "disable", "false", "0", "no"]:
-            if hasattr(self.main_window, 'vision_tab'):
-                self.main_window.vision_tab.debug_var.set(False)
-                self.main_window.vision_tab._toggle_debug()
-                self.main_window.add_message("System", "Debug mode disabled", animate=False)
-        else:
-            self.main_window.add_message("System", f"Invalid debug state: {state}. Use 'on' or 'off'.", animate=False)
+        self._handle_toggle(sub, vision_tab.debug_var.get, set_debug, "debug", "Debug mode")
             
-    def _cmd_image(self, args):
+    def _cmd_image(self, sub, rest):
         """Handle image command for generating images.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        if not args:
+        if not rest:
             self.main_window.add_message("System", "Usage: /image <prompt>", animate=False)
             return
             
-        # Join all args to form the prompt
-        prompt = " ".join(args)
+        # The argument text is the prompt
+        prompt = rest
         
         # Create image generation text
         image_request_text = f"generate image {prompt}"
@@ -336,109 +442,91 @@ class CommandProcessor:
         # Process as a normal image generation request
         self.main_window._process_input(image_request_text)
         
-    def _cmd_status(self, args):
+    def _cmd_status(self, sub, rest):
         """Handle status command for showing system status.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        # Build status report
-        status = "System Status:\n"
-        
-        # Voice status
-        status += f"Voice output: {'enabled' if self.main_window.use_voice_output else 'disabled'}\n"
-        status += f"Voice input: {'enabled' if self.main_window.use_voice_input else 'disabled'}\n"
-        
-        # Vision status
-        vision_active = "enabled" if hasattr(self.main_window, 'use_vision') and self.main_window.use_vision else "disabled"
-        status += f"Vision system: {vision_active}\n"
-        
-        if hasattr(self.main_window, 'vision_system') and self.main_window.vision_system:
-            vision_info = self.main_window.vision_system.get_info()
-            status += f"Camera status: {vision_info.camera_status}\n"
-            status += f"Face detection: {'active' if vision_info.face_detected else 'inactive'}\n"
-        
-        # Content mode
-        if hasattr(self.main_window, 'llm'):
-            content_mode = self.main_window.llm.get_content_mode() if hasattr(self.main_window.llm, 'get_content_mode') else "unknown"
-            status += f"Content mode: {content_mode}\n"
-            
-        # Personality info
-        if hasattr(self.main_window, 'personality_settings') and self.main_window.personality_settings:
-            settings = self.main_window.personality_settings
-            name = settings.get('name', 'Default')
-            status += f"Active personality: {name}"
+        mw = self.main_window
         
+        # Gather the current values; the report text is memoized on them
+        camera = None
+        if self._caps & _CAP_VISION_SYSTEM and mw.vision_system:
+            vision_info = mw.vision_system.get_info()
+            camera = (vision_info.camera_status, bool(vision_info.face_detected))
+            
+        content_mode = None
+        if self._caps & _CAP_LLM:
+            content_mode = mw.llm.get_content_mode() if self._caps & _CAP_CONTENT_MODE else "unknown"
+            
+        personality = None
+        if self._caps & _CAP_PERSONALITY_SETTINGS and mw.personality_settings:
+            personality = mw.personality_settings.get('name', 'Default')
+            
+        status = _render_status(
+            bool(mw.use_voice_output),
+            bool(mw.use_voice_input),
+            bool(self._caps & _CAP_USE_VISION and mw.use_vision),
+            camera,
+            content_mode,
+            personality
+        )
         self.main_window.add_message("System", status, animate=False)
         
-    def _cmd_memory(self, args):
+    def _cmd_memory(self, sub, rest):
         """Handle memory management commands.
         
         Args:
-            args: Command arguments
+            sub: Lower-case first argument, or None without arguments
+            rest: Argument text after the command name
         """
-        if not args:
+        if not self._caps & _CAP_MEMORY:
+            self.main_window.add_message("System", "Memory system not initialized", animate=False)
+            return
+        mm = self.main_window.memory_manager
+        
+        if sub is None:
             # Show memory status
-            if hasattr(self.main_window, 'memory_manager'):
-                context_count = len(self.main_window.memory_manager.get_recent_context(100))
-                status = f"Memory status: {context_count} exchanges in memory"
-                self.main_window.add_message("System", status, animate=False)
-            else:
-                self.main_window.add_message("System", "Memory system not initialized", animate=False)
-                
+            context_count = len(mm.get_recent_context(100))
+            self.main_window.add_message("System", f"Memory status: {context_count} exchanges in memory", animate=False)
             self.main_window.add_message("System", "Usage: /memory [clear|save|load]", animate=False)
             return
             
         # Handle memory subcommands
-        subcmd = args[0].lower()
+        args = rest.split()
         
-        if subcmd == "clear":
+        if sub == "clear":
             # Clear memory
-            if hasattr(self.main_window, 'memory_manager'):
-                self.main_window.memory_manager.clear_memory()
-            else:
-                self.main_window.add_message("System", "Memory system not initialized", animate=False)
+            mm.clear_memory()
                 
-        elif subcmd == "save":
+        elif sub == "save":
             # Save memory to file
-            if hasattr(self.main_window, 'memory_manager'):
-                filename = args[1] if len(args) > 1 else None
-                self.main_window.memory_manager.save_conversation(filename)
-            else:
-                self.main_window.add_message("System", "Memory system not initialized", animate=False)
+            filename = args[1] if len(args) > 1 else None
+            mm.save_conversation(filename)
                 
-        elif subcmd == "load":
+        elif sub == "load":
             # Load memory from file
-            if hasattr(self.main_window, 'memory_manager'):
-                if len(args) > 1:
-                    filename = args[1]
-                    self.main_window.memory_manager.load_conversation(filename)
-                else:
-                    # List available saved conversations
-                    files = self.main_window.memory_manager.list_saved_conversations()
-                    if files:
-                        self.main_window.add_message("System", "Available saved conversations:", animate=False)
-                        for file in files:
-                            self.main_window.add_message("System", f"- {file}", animate=False)
-                        self.main_window.add_message("System", "Use /memory load <filename> to load a conversation", animate=False)
-                    else:
-                        self.main_window.add_message("System", "No saved conversations found", animate=False)
+            if len(args) > 1:
+                mm.load_conversation(args[1])
             else:
-                self.main_window.add_message("System", "Memory system not initialized", animate=False)
-                
-        elif subcmd == "list":
-            # List available saved conversations
-            if hasattr(self.main_window, 'memory_manager'):
-                files = self.main_window.memory_manager.list_saved_conversations()
+                # List available saved conversations
+                files = mm.list_saved_conversations()
                 if files:
-                    self.main_window.add_message("System", "Available saved conversations:", animate=False)
-                    for file in files:
-                        self.main_window.add_message("System", f"- {file}", animate=False)
+                    self.main_window.add_message("System", _format_conversation_list(files), animate=False)
+                    self.main_window.add_message("System", "Use /memory load <filename> to load a conversation", animate=False)
                 else:
                     self.main_window.add_message("System", "No saved conversations found", animate=False)
+                
+        elif sub == "list":
+            # List available saved conversations
+            files = mm.list_saved_conversations()
+            if files:
+                self.main_window.add_message("System", _format_conversation_list(files), animate=False)
             else:
-                self.main_window.add_message("System", "Memory system not initialized", animate=False)
+                self.main_window.add_message("System", "No saved conversations found", animate=False)
                 
         else:
-            self.main_window.add_message("System", f"Unknown memory command: {subcmd}", animate=False)
+            self.main_window.add_message("System", f"Unknown memory command: {sub}", animate=False)
             self.main_window.add_message("System", "Usage: /memory [clear|save|load|list]", animate=False)
\ No newline at end of file
@@ -6,9 +6,9 @@ from tkinter import ttk, scrolledtext, messagebox
 import threading
 import queue
 import time
+from collections import deque
 from datetime import datetime
 from PIL import Image, ImageTk
-import cv2
 import numpy as np
 import logging
 import re
@@ -30,6 +30,27 @@ from ai_core.gui.vision_tab import VisionTab
 from ai_core.gui.chat_tab import ChatTab
 from ai_core.gui.memory_manager import MemoryManager
 
+# Image request parsing patterns, compiled once
+_IMAGE_REQUEST_RE = re.compile(
+    r"(generate|create|make|send)\s+(?:me\s+)?(?:(?:a|an)\s+)?(pic|picture|image|photo)\s*(.*)",
+    re.IGNORECASE
+)
+# Every image request names one of these; "pic" also covers "picture"
+_IMAGE_KEYWORDS = ("pic", "image", "photo")
+_LEADING_FILLER_RE = re.compile(r"^(of|like|showing|about)\s+", re.IGNORECASE)
+_LEADING_SELF_RE = re.compile(r"^(you|yourself)\s*", re.IGNORECASE)
+_SIZE_RE = re.compile(r"size\s+(\d+)x(\d+)", re.IGNORECASE)
+_STYLE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"style\s+([a-zA-Z0-9 ]+)",
+    r"in\s+([a-zA-Z0-9]+)\s+style",
+    r"([a-zA-Z0-9]+)\s+style"
+))
+_NEGATIVE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"negative\s+(.+?)(,|$|\.|;)",
+    r"no\s+(.+?)(,|$|\.|;)",
+    r"without\s+(.+?)(,|$|\.|;)"
+))
+
 class MainWindow:
     """Main application window containing all UI components and logic."""
     
@@ -67,10 +88,28 @@ class MainWindow:
         self.is_listening = False
         self.is_push_to_talk = False
         self.message_queue = queue.Queue()
-        self.typing_speed = 50
+        
+        # Chat turns are handled by one worker, which merges a quick burst of
+        # inputs into a single LLM call
+        self._llm_pending = queue.Queue()
+        self._llm_batch_size = 4
+        self._llm_batch_window = 0.02  # Seconds to wait for follow-up inputs
+        self._llm_thread = threading.Thread(target=self._llm_worker, daemon=True)
+        self._llm_thread.start()
+        
+        self._poll_ms = 15  # Message queue polling interval
+        self.typing_speed = 50  # Milliseconds per character
+        self._typing_chunk = 4  # Characters typed per animation tick
+        self._typing_message = ""
+        self._typing_index = 0
         self.is_typing = False
-        self.image_references = []
-        self.face_detect_var = tk.BooleanVar(value=True)
+        self.image_references = deque(maxlen=20)  # Keeps chat images alive for Tk
+        
+        # Latest-wins handoff from the vision capture thread to the UI thread
+        self._latest_frame = None
+        self._latest_vision_info = None
+        self._vision_pump_ms = 33
+        self._vision_pump_id = None
         
         # Personality Settings Store
         self.personality_settings = {}
@@ -211,12 +250,13 @@ class MainWindow:
         style.configure("TFrame", background=ModernTheme.SURFACE)
         style.configure("TLabel", background=ModernTheme.SURFACE, foreground=ModernTheme.TEXT)
         
-        # Create custom button style with black text
-        style.configure("Custom.TButton",
+        # Button style with black text; every ttk.Button inherits it,
+        # including ones created after the theme is applied
+        style.configure("TButton",
                        background=ModernTheme.PRIMARY,
                        foreground=ModernTheme.TEXT_ON_PRIMARY,
                        padding=(10, 5))
-        style.map("Custom.TButton",
+        style.map("TButton",
                  foreground=[('pressed', 'black'), ('active', 'black')],
                  background=[('pressed', ModernTheme.SECONDARY), ('active', ModernTheme.PRIMARY)])
         
@@ -261,17 +301,6 @@ class MainWindow:
         # Configure status bar
         if hasattr(self, 'status_bar'):
             self.status_bar.configure(background=ModernTheme.SURFACE, foreground=ModernTheme.TEXT)
-            
-        # Configure all buttons to ensure text visibility
-        for widget in self.root.winfo_children():
-            self._configure_child_widgets(widget)
-
-    def _configure_child_widgets(self, widget):
-        """Recursively configure all child widgets."""
-        for child in widget.winfo_children():
-            if isinstance(child, ttk.Button):
-                child.configure(style="Custom.TButton")
-            self._configure_child_widgets(child)
 
     def _create_vision_output_tab(self, parent):
         """Create the vision output tab."""
@@ -298,20 +327,21 @@ class MainWindow:
         self.add_message("You", text, animate=False)
         self.status_var.set("Processing input...")
         
-        # Check for image generation command
-        image_request_match = re.search(
-            r"(generate|create|make|send)\s+(?:me\s+)?(?:(?:a|an)\s+)?(pic|picture|image|photo)\s*(.*)", 
-            text, 
-            re.IGNORECASE
-        )
+        # Check for image generation command, skipping the regex for
+        # ordinary chat that cannot match it
+        lowered = text.lower()
+        if any(keyword in lowered for keyword in _IMAGE_KEYWORDS):
+            image_request_match = _IMAGE_REQUEST_RE.search(text)
+        else:
+            image_request_match = None
         
         if image_request_match:
             # Extract raw potential prompt from group 3
             raw_prompt = image_request_match.group(3).strip()
             
             # Clean up common leading words from the prompt
-            cleaned_prompt = re.sub(r"^(of|like|showing|about)\\s+", "", raw_prompt, flags=re.IGNORECASE).strip()
-            cleaned_prompt = re.sub(r"^(you|yourself)\\s*", "", cleaned_prompt, flags=re.IGNORECASE).strip()
+            cleaned_prompt = _LEADING_FILLER_RE.sub("", raw_prompt).strip()
+            cleaned_prompt = _LEADING_SELF_RE.sub("", cleaned_prompt).strip()
 
             # Use default prompt if cleaning results in an empty string
             final_prompt = cleaned_prompt if cleaned_prompt else "yourself" 
@@ -322,33 +352,65 @@ class MainWindow:
             threading.Thread(target=self._handle_image_generation, args=(final_prompt, text), daemon=True).start()
             self.status_var.set("Generating image...")
         else:
-            # Normal text processing
+            # Hand the input to the LLM worker so the window stays responsive
+            self._llm_pending.put(text)
+
+    def _llm_worker(self):
+        """Collect pending chat inputs and answer each burst with one response."""
+        while True:
+            texts = [self._llm_pending.get()]
             try:
-                # Process input
-                nlp_analysis = self.text_processor.process_text(text)
-                self.emotion_engine.process_text(text)
-                emotional_state = self.emotion_engine.get_emotional_state()
-                
-                # Get conversation context from memory
-                context = self.memory_manager.get_recent_context()
-                
-                # Generate response
-                response = self.llm.generate_response(emotional_state, text, context)
-                
-                # Store the exchange in memory
-                self.memory_manager.add_interaction(text, response)
-                
-                # Handle response output
-                if self.use_voice_output:
-                    # If using voice, show text immediately and speak
-                    self.add_message(self.current_voice_name, response, animate=False)
-                    self.speech_engine.speak(response)
-                else:
-                    # If text only, animate the response
-                    self.add_message(self.current_voice_name, response, animate=True)
+                while len(texts) < self._llm_batch_size:
+                    texts.append(self._llm_pending.get(timeout=self._llm_batch_window))
+            except queue.Empty:
+                pass
+            self._run_llm_pipeline(texts)
+
+    def _run_llm_pipeline(self, texts: list):
+        """Analyze inputs, generate one response and queue it for display; runs on the LLM worker."""
+        text = "\n".join(texts)
+        try:
+            # Process input
+            for item in texts:
+                nlp_analysis = self.text_processor.process_text(item)
+                self.emotion_engine.process_text(item, nlp_analysis['tokens'].token_set)
+            emotional_state = self.emotion_engine.get_emotional_state()
+            
+            # Get conversation context from memory
+            context = self.memory_manager.get_recent_context()
+            
+            # Stream the response into the chat as it is generated
+            self.root.after(0, lambda: self.status_var.set("Streaming..."))
+            self.message_queue.put(("text", self._message_prefix(self.current_voice_name)))
+            parts = []
+            try:
+                for piece in self.llm.generate_response_stream(emotional_state, text, context):
+                    parts.append(piece)
+                    self.message_queue.put(("text", piece))
+            except Exception as e:
+                self.message_queue.put(("text", "\n"))
+                if not parts:
+                    raise
+                # The partial reply stays on screen but is neither stored nor spoken
+                self.logger.error(f"Response stream interrupted: {e}")
+                self.add_message("System", "The response was cut off by a connection error.", animate=False)
+                return
+            self.message_queue.put(("text", "\n"))
+            response = "".join(parts)
+            
+            # Store the exchange in memory
+            self.memory_manager.add_interaction(text, response)
+            
+            # Speak the full response once it is complete
+            if self.use_voice_output:
+                self.speech_engine.speak(response)
                 
-            finally:
-                self.status_var.set("Ready")
+        except Exception as e:
+            self.logger.error(f"Error generating response: {e}")
+            self.add_message("System", "Sorry, I had trouble formulating a response.", animate=False)
+            
+        finally:
+            self.root.after(0, lambda: self.status_var.set("Ready"))
 
     def _handle_image_generation(self, prompt: str, original_text: str):
         """Handle image generation and generate a text response in a background thread."""
@@ -368,8 +430,9 @@ class MainWindow:
             generated_image = self.image_generator.generate_image(**params)
             
             if generated_image:
-                # Image generation successful - queue image for display
-                self.message_queue.put(("image", generated_image))
+                # Image generation successful - scale for the chat here, off
+                # the Tk thread, then queue it for display
+                self.message_queue.put(("image", self._fit_chat_image(generated_image)))
                 
                 # Save the image
                 saved_path = self.image_generator.save_image(generated_image, f"character_{int(time.time())}")
@@ -379,10 +442,10 @@ class MainWindow:
                 image_success = True
             else:
                 # Image generation failed
-                self.message_queue.put(("System: Sorry, I couldn't generate the image.\n", False))
+                self.message_queue.put(("text", "System: Sorry, I couldn't generate the image.\n"))
         except Exception as e:
             self.logger.error(f"Error during image generation: {e}")
-            self.message_queue.put(("System: An error occurred during image generation.\n", False))
+            self.message_queue.put(("text", "System: An error occurred during image generation.\n"))
 
         # Now, generate a text response based on the outcome and original request
         try:
@@ -406,15 +469,14 @@ class MainWindow:
             
             # Add the text response to the queue
             if self.use_voice_output:
-                self.message_queue.put((f"{self.current_voice_name}: {response}\n", False)) # Text first
+                self.message_queue.put(("text", f"{self.current_voice_name}: {response}\n")) # Text first
                 self.speech_engine.speak(response) # Then speak
             else:
-                self.message_queue.put((f"{self.current_voice_name}: ", False)) # Prefix
-                self.message_queue.put((response + "\n", True)) # Animate the response
+                self.message_queue.put(("anim", f"{self.current_voice_name}: ", response + "\n")) # Animate the response
                 
         except Exception as e:
             self.logger.error(f"Error generating text response after image generation: {e}")
-            self.message_queue.put(("System: Sorry, I had trouble formulating a response after the image request.\n", False))
+            self.message_queue.put(("text", "System: Sorry, I had trouble formulating a response after the image request.\n"))
             
         finally:
             # Ensure status is updated after generation attempt
@@ -425,7 +487,7 @@ class MainWindow:
         params = {}
         
         # Parse size
-        size_match = re.search(r"size\s+(\d+)x(\d+)", text, re.IGNORECASE)
+        size_match = _SIZE_RE.search(text)
         if size_match:
             try:
                 width = min(int(size_match.group(1)), 1024)  # Cap at 1024 for safety
@@ -435,14 +497,8 @@ class MainWindow:
                 pass
                 
         # Parse style
-        style_patterns = [
-            r"style\s+([a-zA-Z0-9 ]+)", 
-            r"in\s+([a-zA-Z0-9]+)\s+style",
-            r"([a-zA-Z0-9]+)\s+style"
-        ]
-        
-        for pattern in style_patterns:
-            style_match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _STYLE_RES:
+            style_match = pattern.search(text)
             if style_match:
                 style = style_match.group(1).strip()
                 if style:
@@ -450,15 +506,9 @@ class MainWindow:
                 break
                 
         # Parse negative prompt
-        negative_patterns = [
-            r"negative\s+(.+?)(,|$|\.|;)",
-            r"no\s+(.+?)(,|$|\.|;)",
-            r"without\s+(.+?)(,|$|\.|;)",
-        ]
-        
         negative_prompts = []
-        for pattern in negative_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for pattern in _NEGATIVE_RES:
+            for match in pattern.finditer(text):
                 if match.group(1).strip():
                     negative_prompts.append(match.group(1).strip())
                     
@@ -469,37 +519,38 @@ class MainWindow:
 
     def process_messages(self):
         """Process and display queued messages."""
+        received = False
         if not self.is_typing:
+            # Consecutive plain text messages are joined into one insert
+            text_buf = []
             try:
                 while True:
                     message_data = self.message_queue.get_nowait()
+                    received = True
                     
-                    if isinstance(message_data, tuple) and len(message_data) == 2:
-                        message_type, content = message_data
-                        
-                        if message_type == "image":
-                            # Handle image display
-                            self._display_image_in_chat(content)
-                        else:
-                            # Handle text message
-                            message, should_animate = message_type, content 
-                            if should_animate:
-                                # Start typing animation
-                                self.is_typing = True
-                                self._animate_typing(message, 0)
-                            else:
-                                # Display message immediately
-                                self.chat_text.insert(tk.END, message)
-                                self.chat_text.see(tk.END)
+                    # Messages are tagged tuples: ("text", text),
+                    # ("anim", prefix, body) or ("image", pil_image)
+                    message_type = message_data[0] if isinstance(message_data, tuple) else None
+                    
+                    if message_type == "text":
+                        # Display message with this tick's batch
+                        text_buf.append(message_data[1])
+                    elif message_type == "anim":
+                        # Show the prefix at once and type the body; later
+                        # messages wait until the animation ends
+                        text_buf.append(message_data[1])
+                        self._flush_text(text_buf)
+                        self.is_typing = True
+                        self._animate_typing(message_data[2], 0)
+                        break
+                    elif message_type == "image":
+                        # Handle image display
+                        self._flush_text(text_buf)
+                        self._display_image_in_chat(message_data[1])
                     else:
-                        # Handle legacy message format
+                        # Handle unknown message formats as plain text
                         self.logger.warning(f"Received unexpected message format: {type(message_data)}")
-                        try:
-                            message = str(message_data)
-                            self.chat_text.insert(tk.END, message)
-                            self.chat_text.see(tk.END)
-                        except Exception as fmt_e:
-                             self.logger.error(f"Could not handle legacy message format: {fmt_e}")
+                        text_buf.append(str(message_data))
                         
             except queue.Empty:
                 pass
@@ -507,28 +558,41 @@ class MainWindow:
                 self.logger.error(f"Error processing message queue: {e}")
                 import traceback
                 self.logger.error(traceback.format_exc())
+            finally:
+                self._flush_text(text_buf)
         
-        # Schedule next update
-        self.root.after(100, self.process_messages)
+        # Check again as soon as Tk is idle while messages are arriving,
+        # and fall back to the polling interval once the queue is quiet
+        if received and not self.is_typing:
+            self.root.after_idle(self.process_messages)
+        else:
+            self.root.after(self._poll_ms, self.process_messages)
+
+    def _flush_text(self, text_buf):
+        """Insert buffered chat text with a single insert and scroll."""
+        if text_buf:
+            self.chat_text.insert(tk.END, "".join(text_buf))
+            self.chat_text.see(tk.END)
+            text_buf.clear()
+
+    @staticmethod
+    def _fit_chat_image(pil_image: Image.Image, max_width: int = 300) -> Image.Image:
+        """Scale an image down to the chat width; safe to call from worker threads."""
+        img_width, img_height = pil_image.size
+        if img_width > max_width:
+            scale = max_width / img_width
+            new_height = int(img_height * scale)
+            pil_image = pil_image.resize((max_width, new_height), Image.LANCZOS)
+        return pil_image
 
     def _display_image_in_chat(self, pil_image: Image.Image):
-        """Displays a PIL image directly in the chat text widget."""
+        """Displays a PIL image, already sized by _fit_chat_image, in the chat text widget."""
         try:
-            # Resize image to fit chat width
-            max_width = 300
-            img_width, img_height = pil_image.size
-            if img_width > max_width:
-                scale = max_width / img_width
-                new_height = int(img_height * scale)
-                pil_image = pil_image.resize((max_width, new_height), Image.LANCZOS)
-            
             # Convert PIL image to PhotoImage
             photo_image = ImageTk.PhotoImage(pil_image)
             
-            # Keep a reference to prevent garbage collection
+            # Keep a reference to prevent garbage collection; the deque drops the oldest
             self.image_references.append(photo_image)
-            if len(self.image_references) > 20:
-                self.image_references.pop(0)
             
             # Insert image into chat
             self.chat_text.image_create(tk.END, image=photo_image)
@@ -541,27 +605,39 @@ class MainWindow:
 
     def _animate_typing(self, message, index):
         """Animate typing effect for a message."""
+        self._typing_message = message
+        self._typing_index = index
+        self._tick_typing()
+
+    def _tick_typing(self):
+        """Type the next chunk of the current message and reschedule."""
+        message = self._typing_message
+        index = self._typing_index
         if index < len(message):
-            self.chat_text.insert(tk.END, message[index])
+            end = index + self._typing_chunk
+            self.chat_text.insert(tk.END, message[index:end])
             self.chat_text.see(tk.END)
-            self.root.after(self.typing_speed, 
-                          lambda: self._animate_typing(message, index + 1))
+            self._typing_index = end
+            self.root.after(self.typing_speed * self._typing_chunk, self._tick_typing)
         else:
+            self._typing_message = ""
             self.is_typing = False
 
+    @staticmethod
+    def _message_prefix(sender: str) -> str:
+        """Return the timestamped '[HH:MM:SS] sender: ' prefix for a chat line."""
+        return f"[{datetime.now().strftime('%H:%M:%S')}] {sender}: "
+
     def add_message(self, sender: str, message: str, animate=False):
         """Add a message to the queue for display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        prefix = f"[{timestamp}] {sender}: "
+        prefix = self._message_prefix(sender)
         
         if not animate:
             # Add message immediately
-            self.message_queue.put((prefix + message + "\n", False))
+            self.message_queue.put(("text", prefix + message + "\n"))
         else:
-            # Add prefix without animation
-            self.message_queue.put((prefix, False))
-            # Add message with animation
-            self.message_queue.put((message + "\n", True))
+            # Show the prefix, then animate the message
+            self.message_queue.put(("anim", prefix, message + "\n"))
 
     def _initialize_voice_input(self):
         """Initialize or reinitialize the voice input component."""
@@ -643,88 +719,43 @@ class MainWindow:
         pass
         
     def _start_vision_update(self):
-        """Start the vision update loop."""
+        """Start drawing the vision system's frames."""
         if not self.use_vision or not self.vision_system:
             return
             
-        # Load face cascade for direct detection if needed
-        if self.face_detect_var.get() and not hasattr(self, 'face_cascade'):
-            try:
-                cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-                self.face_cascade = cv2.CascadeClassifier(cascade_path)
-                self.logger.info("Loaded face cascade for direct detection")
-            except Exception as e:
-                self.logger.error(f"Error loading face cascade: {e}")
-                self.face_cascade = None
-                
-        # Function to update frames
-        def update_vision():
-            try:
-                while self.use_vision:
-                    try:
-                        # Get frame from vision system
-                        frame = self.vision_system.get_current_frame()
-                        
-                        if frame is not None:
-                            # Process frame with face detection, etc.
-                            processed_frame = self.vision_system.process_frame(frame)
-                            
-                            # Direct face detection in GUI for stability if needed
-                            if hasattr(self, 'face_cascade') and self.face_cascade and self.face_detect_var.get():
-                                self._apply_direct_face_detection(processed_frame)
-                            
-                            # Update UI with processed frame
-                            self.vision_tab._update_vision_canvas(processed_frame)
-                            
-                            # Get and display vision info
-                            vision_info = self.vision_system.get_vision_info()
-                            if vision_info:
-                                self.vision_tab._update_vision_info(vision_info)
-                                
-                        # Delay to control frame rate
-                        time.sleep(0.03)  # ~30 FPS
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error in vision update loop: {e}")
-                        self.vision_tab._handle_vision_error(str(e))
-                        time.sleep(1.0)  # Wait a bit before retrying
-                        
-            except Exception as e:
-                self.logger.error(f"Vision update thread error: {e}")
-                self.status_var.set("Vision system error")
-                
-        # Start update thread
-        vision_thread = threading.Thread(target=update_vision, daemon=True)
-        vision_thread.start()
-        
-    def _apply_direct_face_detection(self, frame):
-        """Apply direct face detection to reduce flickering"""
-        try:
-            # Convert to grayscale for face detection
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            
-            # Apply face detection
-            faces = self.face_cascade.detectMultiScale(
-                gray, 
-                scaleFactor=1.2, 
-                minNeighbors=4, 
-                minSize=(30, 30)
-            )
+        # The vision system's capture thread produces annotated frames through
+        # post_vision_frame; the UI-side pump draws them. Replace a pump left
+        # over from a previous run.
+        if self._vision_pump_id is not None:
+            self.root.after_cancel(self._vision_pump_id)
+        self._vision_pump_id = self.root.after(self._vision_pump_ms, self._pump_vision)
+        
+    def post_vision_frame(self, frame):
+        """Hand an annotated frame to the UI pump; safe to call from any thread."""
+        # An undrawn older frame is simply replaced
+        self._latest_frame = frame
+        
+    def post_vision_info(self, info):
+        """Hand a vision info string to the UI pump; safe to call from any thread."""
+        self._latest_vision_info = info
+        
+    def _pump_vision(self):
+        """Draw the most recent vision frame and info on the UI thread."""
+        if not self.use_vision:
+            self._latest_frame = None
+            self._latest_vision_info = None
+            self._vision_pump_id = None
+            return
             
-            # Draw face rectangles for stability
-            for (x, y, w, h) in faces:
-                cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 3)
-                
-            # If any faces were detected, update the status bar
-            if len(faces) > 0 and not self.vision_system.get_info().face_detected:
-                # This adds an extra indication of face presence
-                self.status_var.set(f"Face detected ({len(faces)})")
+        frame, self._latest_frame = self._latest_frame, None
+        if frame is not None:
+            self.vision_tab._update_vision_canvas(frame)
+        vision_info, self._latest_vision_info = self._latest_vision_info, None
+        if vision_info:
+            self.vision_tab._update_vision_info(vision_info)
                 
-        except Exception as e:
-            # Silently fail on errors since this is just a stabilization feature
-            self.logger.debug(f"Direct face detection error: {e}")
-            pass
-
+        self._vision_pump_id = self.root.after(self._vision_pump_ms, self._pump_vision)
+        
     def _attempt_camera_recovery(self):
         """Attempt to recover from camera failure."""
         self.add_message("System", "Attempting to recover camera...", animate=False)
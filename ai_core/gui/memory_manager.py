@@ -2,6 +2,7 @@
 Memory manager for the AI Companion application.
 Manages conversation history and memory.
 """
+import functools
 import logging
 from typing import List, Tuple, Dict, Any, Optional
 from datetime import datetime
@@ -10,6 +11,13 @@ import json
 
 from ai_core.memory.conversation_memory import ConversationMemory
 
+
+@functools.lru_cache(maxsize=1)
+def _ensure_directory(path: str) -> None:
+    """Create the save directory; later calls for the same path are no-ops."""
+    os.makedirs(path, exist_ok=True)
+
+
 class MemoryManager:
     """
     Manage conversation history and memory for the AI companion.
@@ -33,8 +41,21 @@ class MemoryManager:
         self.context_window_size = 5  # Number of exchanges to include in context
         self.save_directory = "conversation_history"
         
-        # Create save directory if it doesn't exist
-        os.makedirs(self.save_directory, exist_ok=True)
+        # Bumped on every change to memory; keys the cached context
+        self._version = 0
+        self._context_cache = (-1, None, [])  # (version, max_exchanges, context)
+        self._formatted_cache: Dict[int, str] = {}  # max_exchanges -> history text
+        
+        # Last emotion view seen and its plain copy, shared by exchanges
+        # recorded while the state is unchanged
+        self._last_emotion_view = None
+        self._last_emotion_snapshot = None
+        
+        # Create save directory if it doesn't exist (once per process)
+        _ensure_directory(self.save_directory)
+        
+        # Every exchange of this session is appended to its own log
+        self._session_file = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
         
         self.logger.info("Memory manager initialized")
         
@@ -56,15 +77,28 @@ class MemoryManager:
             # Add emotional state if available
             if hasattr(self.main_window, 'emotion_engine'):
                 emotion_state = self.main_window.emotion_engine.get_emotional_state()
-                metadata['emotional_state'] = emotion_state
+                # The engine returns a read-only view that stays the same object
+                # until the state changes; copy it only when it is new
+                if emotion_state is not self._last_emotion_view:
+                    self._last_emotion_view = emotion_state
+                    self._last_emotion_snapshot = {**emotion_state, 'emotions': dict(emotion_state['emotions'])}
+                metadata['emotional_state'] = self._last_emotion_snapshot
                 
             # Add to conversation memory
-            self.conversation_memory.add_exchange(user_input, ai_response, metadata)
-            self.logger.debug(f"Added interaction to memory: User: '{user_input[:30]}...', AI: '{ai_response[:30]}...'")
+            exchange = self.conversation_memory.add_exchange(user_input, ai_response, metadata)
+            self._memory_changed()
+            self.save_append(exchange)
+            # Lazy %-formatting: nothing is sliced or built unless DEBUG is on
+            self.logger.debug("Added interaction to memory: User: '%.30s...', AI: '%.30s...'", user_input, ai_response)
             
         except Exception as e:
             self.logger.error(f"Error adding interaction to memory: {e}")
             
+    def _memory_changed(self) -> None:
+        """Invalidate the cached context after conversation memory changes."""
+        self._version += 1
+        self._formatted_cache.clear()
+        
     def get_recent_context(self, max_exchanges: int = None) -> List[Tuple[str, str]]:
         """
         Get recent conversation context for LLM.
@@ -73,13 +107,19 @@ class MemoryManager:
             max_exchanges: Maximum number of exchanges to include (defaults to context_window_size)
             
         Returns:
-            List of (user_input, ai_response) tuples
+            List of (user_input, ai_response) tuples, shared until memory changes
         """
         if max_exchanges is None:
             max_exchanges = self.context_window_size
             
+        version, cached_max, context = self._context_cache
+        if version == self._version and cached_max == max_exchanges:
+            return context
+            
         try:
-            return self.conversation_memory.get_recent_exchanges(max_exchanges)
+            context = self.conversation_memory.get_recent_exchanges(max_exchanges)
+            self._context_cache = (self._version, max_exchanges, context)
+            return context
         except Exception as e:
             self.logger.error(f"Error getting recent context: {e}")
             return []
@@ -97,8 +137,14 @@ class MemoryManager:
         if max_exchanges is None:
             max_exchanges = self.context_window_size
             
+        formatted = self._formatted_cache.get(max_exchanges)
+        if formatted is not None:
+            return formatted
+            
         try:
-            return self.conversation_memory.get_formatted_history(max_exchanges)
+            formatted = self.conversation_memory.get_formatted_history(max_exchanges)
+            self._formatted_cache[max_exchanges] = formatted
+            return formatted
         except Exception as e:
             self.logger.error(f"Error getting formatted context: {e}")
             return ""
@@ -107,6 +153,7 @@ class MemoryManager:
         """Clear all conversation memory."""
         try:
             self.conversation_memory.clear()
+            self._memory_changed()
             self.logger.info("Conversation memory cleared")
             self.main_window.add_message("System", "Conversation memory cleared", animate=False)
         except Exception as e:
@@ -139,6 +186,19 @@ class MemoryManager:
             self.main_window.add_message("System", f"Error saving conversation: {str(e)}", animate=False)
             return False
             
+    def save_append(self, exchange) -> None:
+        """
+        Append an exchange to this session's log file.
+        
+        Args:
+            exchange: ConversationExchange returned by add_exchange
+        """
+        try:
+            filepath = os.path.join(self.save_directory, self._session_file)
+            self.conversation_memory.append_to_file(filepath, exchange)
+        except Exception as e:
+            self.logger.error(f"Error appending to session log: {e}")
+            
     def load_conversation(self, filename: str) -> bool:
         """
         Load a conversation from a file.
@@ -151,12 +211,13 @@ class MemoryManager:
         """
         try:
             filepath = os.path.join(self.save_directory, filename)
-            if not os.path.exists(filepath):
+            try:
+                success = self.conversation_memory.load_from_file(filepath)
+            except FileNotFoundError:
                 self.logger.error(f"Conversation file not found: {filepath}")
                 self.main_window.add_message("System", f"Conversation file not found: {filename}", animate=False)
                 return False
-                
-            success = self.conversation_memory.load_from_file(filepath)
+            self._memory_changed()
             
             if success:
                 self.logger.info(f"Conversation loaded from {filepath}")
@@ -180,8 +241,9 @@ class MemoryManager:
             List of filenames
         """
         try:
-            files = os.listdir(self.save_directory)
-            return [f for f in files if f.endswith('.json')]
+            with os.scandir(self.save_directory) as entries:
+                return [entry.name for entry in entries
+                        if entry.name.endswith(('.json', '.jsonl')) and entry.is_file()]
         except Exception as e:
             self.logger.error(f"Error listing saved conversations: {e}")
             return [] 
\ No newline at end of file
@@ -17,6 +17,23 @@ class PersonalityTab(ttk.Frame):
         self.personality_settings = {}
         # We will store tk variables here to easily access/save settings
         self._personality_vars = {}
+        
+        # Personality picker dialog; built on first use, then hidden and reused
+        self._picker_window = None
+        
+        # Variable groups handled together by the Random/Select All style
+        # buttons, filled in as the widgets are created
+        self._question_vars = []
+        self._rel_dyn_vars = []
+        self._comfort_vars = []
+        self._topic_vars = []
+        self._scale_vars = []  # trait_ and style_ sliders
+        
+        # Quirks are kept as bits of a plain int rather than one Tcl variable
+        # each; bit i belongs to _quirk_keys[i] and the widget _quirk_paths[i]
+        self._quirks_mask = 0
+        self._quirk_keys = []
+        self._quirk_paths = []
 
         self._create_widgets()
         print("PersonalityTab: Initialization complete")
@@ -67,50 +84,41 @@ class PersonalityTab(ttk.Frame):
         profile_container = ttk.Frame(parent)
         profile_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Left column - Basic profile info
+        # Left column - Basic profile info, one grid row per field
         left_frame = ttk.Frame(profile_container)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        left_frame.columnconfigure(1, weight=1)
         
         # Name
-        name_frame = ttk.Frame(left_frame)
-        name_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(name_frame, text="Name").grid(row=0, column=0, sticky="w", padx=5)
+        ttk.Label(left_frame, text="Name").grid(row=0, column=0, sticky="w", padx=5, pady=2)
         self._personality_vars['name'] = tk.StringVar(value="")
-        ttk.Entry(name_frame, textvariable=self._personality_vars['name']).grid(row=0, column=1, sticky="ew", padx=5)
-        name_frame.columnconfigure(1, weight=1)
+        ttk.Entry(left_frame, textvariable=self._personality_vars['name']).grid(
+            row=0, column=1, columnspan=2, sticky="ew", padx=5, pady=2)
         
         # Nickname
-        nickname_frame = ttk.Frame(left_frame)
-        nickname_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(nickname_frame, text="Nickname").grid(row=0, column=0, sticky="w", padx=5)
+        ttk.Label(left_frame, text="Nickname").grid(row=1, column=0, sticky="w", padx=5, pady=2)
         self._personality_vars['nickname'] = tk.StringVar(value="")
-        ttk.Entry(nickname_frame, textvariable=self._personality_vars['nickname']).grid(row=0, column=1, sticky="ew", padx=5)
-        nickname_frame.columnconfigure(1, weight=1)
+        ttk.Entry(left_frame, textvariable=self._personality_vars['nickname']).grid(
+            row=1, column=1, columnspan=2, sticky="ew", padx=5, pady=2)
         
         # Personality Type
-        personality_frame = ttk.Frame(left_frame)
-        personality_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(personality_frame, text="Personality").grid(row=0, column=0, sticky="w", padx=5)
+        ttk.Label(left_frame, text="Personality").grid(row=2, column=0, sticky="w", padx=5, pady=2)
         self._personality_vars['personality_type'] = tk.StringVar(value="")
         
-        personality_entry = ttk.Entry(personality_frame, textvariable=self._personality_vars['personality_type'])
-        personality_entry.grid(row=0, column=1, sticky="ew", padx=5)
+        personality_entry = ttk.Entry(left_frame, textvariable=self._personality_vars['personality_type'])
+        personality_entry.grid(row=2, column=1, sticky="ew", padx=5, pady=2)
         
         # Personality type picker button
-        personality_picker = ttk.Button(personality_frame, text="...", width=3, 
+        personality_picker = ttk.Button(left_frame, text="...", width=3, 
                                       command=lambda: self._show_personality_picker())
-        personality_picker.grid(row=0, column=2, padx=(0, 5))
-        
-        personality_frame.columnconfigure(1, weight=1)
+        personality_picker.grid(row=2, column=2, padx=(0, 5), pady=2)
         
         # Blood Type
-        blood_frame = ttk.Frame(left_frame)
-        blood_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(blood_frame, text="Blood Type").grid(row=0, column=0, sticky="w", padx=5)
+        ttk.Label(left_frame, text="Blood Type").grid(row=3, column=0, sticky="w", padx=5, pady=2)
         
         # Blood Type radiobuttons
-        blood_type_frame = ttk.Frame(blood_frame)
-        blood_type_frame.grid(row=0, column=1, sticky="w")
+        blood_type_frame = ttk.Frame(left_frame)
+        blood_type_frame.grid(row=3, column=1, columnspan=2, sticky="w", pady=2)
         
         self._personality_vars['blood_type'] = tk.StringVar(value="O")
         
@@ -120,12 +128,10 @@ class PersonalityTab(ttk.Frame):
                            variable=self._personality_vars['blood_type']).grid(row=0, column=i, padx=10)
         
         # Birthday
-        birthday_frame = ttk.Frame(left_frame)
-        birthday_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(birthday_frame, text="Birthday").grid(row=0, column=0, sticky="w", padx=5)
+        ttk.Label(left_frame, text="Birthday").grid(row=4, column=0, sticky="w", padx=5, pady=2)
         
-        birthday_subframe = ttk.Frame(birthday_frame)
-        birthday_subframe.grid(row=0, column=1, sticky="w")
+        birthday_subframe = ttk.Frame(left_frame)
+        birthday_subframe.grid(row=4, column=1, columnspan=2, sticky="w", pady=2)
         
         # Month dropdown
         self._personality_vars['birth_month'] = tk.IntVar(value=1)
@@ -144,62 +150,46 @@ class PersonalityTab(ttk.Frame):
         ttk.Label(birthday_subframe, text="Day").grid(row=0, column=3, sticky="w")
         
         # Club/Interest
-        club_frame = ttk.Frame(left_frame)
-        club_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(club_frame, text="Club").grid(row=0, column=0, sticky="w", padx=5)
+        ttk.Label(left_frame, text="Club").grid(row=5, column=0, sticky="w", padx=5, pady=2)
         
         club_values = ["None", "Art", "Music", "Science", "Sports", "Literature", "Technology", "Cooking", "Gaming"]
         self._personality_vars['club'] = tk.StringVar(value="None")
-        club_dropdown = ttk.Combobox(club_frame, textvariable=self._personality_vars['club'],
+        club_dropdown = ttk.Combobox(left_frame, textvariable=self._personality_vars['club'],
                                     values=club_values)
-        club_dropdown.grid(row=0, column=1, sticky="ew", padx=5)
-        club_frame.columnconfigure(1, weight=1)
+        club_dropdown.grid(row=5, column=1, columnspan=2, sticky="ew", padx=5, pady=2)
         
         # Voice Pitch slider
-        voice_frame = ttk.Frame(left_frame)
-        voice_frame.pack(fill=tk.X, pady=2)
-        
-        ttk.Label(voice_frame, text="Voice Pitch (Low - High)").grid(row=0, column=0, sticky="w", padx=5)
+        ttk.Label(left_frame, text="Voice Pitch (Low - High)").grid(row=6, column=0, sticky="w", padx=5, pady=2)
         self._personality_vars['voice_pitch'] = tk.IntVar(value=50)
         
-        voice_slider_frame = ttk.Frame(voice_frame)
-        voice_slider_frame.grid(row=0, column=1, sticky="ew", padx=5)
-        
-        voice_slider = ttk.Scale(voice_slider_frame, variable=self._personality_vars['voice_pitch'], 
-                               from_=0, to=100, orient=tk.HORIZONTAL)
-        voice_slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        voice_slider_frame = ttk.Frame(left_frame)
+        voice_slider_frame.grid(row=6, column=1, columnspan=2, sticky="ew", padx=5, pady=2)
         
         # Display current value
         voice_value = ttk.Label(voice_slider_frame, text="50")
-        voice_value.pack(side=tk.LEFT, padx=(0, 5))
-        
-        # Update label when slider changes
-        def update_voice_value(event):
-            voice_value.configure(text=str(self._personality_vars['voice_pitch'].get()))
         
-        voice_slider.bind("<Motion>", update_voice_value)
+        # The scale's command runs only when the value changes and receives
+        # the new value, so the label needs no event binding or variable read
+        voice_slider = ttk.Scale(voice_slider_frame, variable=self._personality_vars['voice_pitch'], 
+                               from_=0, to=100, orient=tk.HORIZONTAL,
+                               command=lambda v: voice_value.configure(text=str(int(float(v)))))
+        voice_slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        voice_value.pack(side=tk.LEFT, padx=(0, 5))
         
         # Reset button for voice pitch
         voice_reset = ttk.Button(voice_slider_frame, text="Reset",
                                command=lambda: self._reset_voice_pitch())
         voice_reset.pack(side=tk.LEFT)
         
-        voice_frame.columnconfigure(1, weight=1)
-        
         # Author history
-        history_frame = ttk.Frame(left_frame)
-        history_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(history_frame, text="Author history").grid(row=0, column=0, sticky="w", padx=5)
-        ttk.Label(history_frame, text="[Empty]").grid(row=0, column=1, sticky="w", padx=5)
+        ttk.Label(left_frame, text="Author history").grid(row=7, column=0, sticky="w", padx=5, pady=2)
+        ttk.Label(left_frame, text="[Empty]").grid(row=7, column=1, columnspan=2, sticky="w", padx=5, pady=2)
         
         # User nickname field
-        user_frame = ttk.Frame(left_frame)
-        user_frame.pack(fill=tk.X, pady=2)
-        ttk.Label(user_frame, text="Your nickname").grid(row=0, column=0, sticky="w", padx=5)
+        ttk.Label(left_frame, text="Your nickname").grid(row=8, column=0, sticky="w", padx=5, pady=2)
         
-        user_nickname_frame = ttk.Frame(user_frame)
-        user_nickname_frame.grid(row=0, column=1, sticky="ew")
-        user_frame.columnconfigure(1, weight=1)
+        user_nickname_frame = ttk.Frame(left_frame)
+        user_nickname_frame.grid(row=8, column=1, columnspan=2, sticky="ew", pady=2)
         
         self._personality_vars['user_nickname'] = tk.StringVar(value="Anonymous")
         user_entry = ttk.Entry(user_nickname_frame, textvariable=self._personality_vars['user_nickname'])
@@ -210,7 +200,8 @@ class PersonalityTab(ttk.Frame):
         user_reset.pack(side=tk.LEFT)
         
         # Info text
-        ttk.Label(left_frame, text="Your nickname will be saved to the profile and used in the AI's responses.").pack(pady=5)
+        ttk.Label(left_frame, text="Your nickname will be saved to the profile and used in the AI's responses.").grid(
+            row=9, column=0, columnspan=3, pady=5)
 
     def _reset_voice_pitch(self):
         """Reset voice pitch to default (50)."""
@@ -222,10 +213,19 @@ class PersonalityTab(ttk.Frame):
         
     def _show_personality_picker(self):
         """Show a dialog to pick a personality type."""
+        current = self._personality_vars['personality_type'].get() or "Pure Heart"
+        if self._picker_window is not None and self._picker_window.winfo_exists():
+            self._personality_vars['personality_picker'].set(current)
+            self._picker_window.deiconify()
+            self._picker_window.grab_set()
+            return
+            
         picker_window = tk.Toplevel(self.main_app.root)
+        self._picker_window = picker_window
         picker_window.title("Select a personality type")
         picker_window.transient(self.main_app.root)
         picker_window.grab_set()
+        picker_window.protocol("WM_DELETE_WINDOW", self._hide_personality_picker)
         
         # Make the window modal
         picker_window.geometry("400x500")
@@ -249,7 +249,7 @@ class PersonalityTab(ttk.Frame):
         ]
         
         # Create radio buttons for each personality type
-        self._personality_vars['personality_picker'] = tk.StringVar(value=self._personality_vars['personality_type'].get() or "Pure Heart")
+        self._personality_vars['personality_picker'] = tk.StringVar(value=current)
         
         # Create a scrollable frame for the radio buttons
         canvas = tk.Canvas(frame, borderwidth=0, highlightthickness=0)
@@ -291,18 +291,66 @@ class PersonalityTab(ttk.Frame):
         button_frame.pack(fill=tk.X, pady=10)
         
         cancel_button = ttk.Button(button_frame, text="Cancel", 
-                                 command=picker_window.destroy)
+                                 command=self._hide_personality_picker)
         cancel_button.pack(side=tk.RIGHT, padx=5)
         
         ok_button = ttk.Button(button_frame, text="OK", 
-                             command=lambda: self._apply_personality_selection(picker_window))
+                             command=self._apply_personality_selection)
         ok_button.pack(side=tk.RIGHT, padx=5)
         
-    def _apply_personality_selection(self, window):
-        """Apply the selected personality type and close the window."""
+    def _hide_personality_picker(self):
+        """Hide the personality picker, keeping its widgets for the next use."""
+        self._picker_window.grab_release()
+        self._picker_window.withdraw()
+        
+    def _apply_personality_selection(self):
+        """Apply the selected personality type and close the picker."""
         selected = self._personality_vars['personality_picker'].get()
         self._personality_vars['personality_type'].set(selected)
-        window.destroy()
+        self._hide_personality_picker()
+
+    def _fast_check(self, parent, text, name, row, col, *options):
+        """
+        Create and grid a ttk checkbutton with two direct Tcl calls.
+        
+        This bypasses ttk.Checkbutton, which converts each option separately
+        and keeps a Python wrapper per widget. The widget is not reachable
+        from Python afterwards except through its Tcl path.
+        
+        Args:
+            parent: Widget to create the checkbutton in
+            text: Checkbutton label
+            name: Widget name within parent
+            row: Grid row in parent
+            col: Grid column in parent
+            *options: Further Tcl option/value pairs, e.g. '-variable', varname
+            
+        Returns:
+            Tcl path of the new checkbutton
+        """
+        path = f"{parent}.{name}"
+        self.tk.call('ttk::checkbutton', path, '-text', text, *options)
+        self.tk.call('grid', path, '-row', row, '-column', col, '-sticky', 'w', '-pady', 2)
+        return path
+        
+    def _fast_radio(self, parent, text, varname, value, row, col):
+        """
+        Create and grid a ttk radiobutton with two direct Tcl calls.
+        
+        Like _fast_check, but the widget sets varname to value when selected
+        and is named after it.
+        
+        Args:
+            parent: Widget to create the radiobutton in
+            text: Radiobutton label, also used in the widget name
+            varname: Name of the Tcl variable shared by the group
+            value: Value stored in the variable when selected
+            row: Grid row in parent
+            col: Grid column in parent
+        """
+        path = f"{parent}.{varname}_{text.lower()}"
+        self.tk.call('ttk::radiobutton', path, '-text', text, '-value', value, '-variable', varname)
+        self.tk.call('grid', path, '-row', row, '-column', col, '-padx', 20)
 
     def _create_quirks_subtab(self, parent):
         """Populates the Quirks sub-tab with personality trait checkboxes."""
@@ -323,10 +371,13 @@ class PersonalityTab(ttk.Frame):
             "Sporty", "Serious", "Into Girls"
         ]
         
-        # Create BooleanVars for each quirk
-        for quirk in quirks:
-            var_name = f"quirk_{quirk.lower().replace(' ', '_')}"
-            self._personality_vars[var_name] = tk.BooleanVar(value=False)
+        # Settings key for each quirk; its index is the quirk's bit
+        self._quirk_keys = [f"quirk_{quirk.lower().replace(' ', '_')}" for quirk in quirks]
+        self._quirk_paths = [None] * len(quirks)
+        
+        # The checkbuttons have no variable and toggle their own selected
+        # state; one registered command, given the quirk index, flips the bit
+        toggle_command = self.register(self._toggle_quirk_bit)
         
         # Define the grid layout
         num_columns = 3
@@ -341,15 +392,10 @@ class PersonalityTab(ttk.Frame):
             for i in range(rows_per_column):
                 idx = col * rows_per_column + i
                 if idx < len(quirks):
-                    quirk = quirks[idx]
-                    var_name = f"quirk_{quirk.lower().replace(' ', '_')}"
-                    
-                    cb = ttk.Checkbutton(
-                        col_frame, 
-                        text=quirk,
-                        variable=self._personality_vars[var_name]
-                    )
-                    cb.grid(row=i, column=0, sticky="w", pady=2)
+                    self._quirk_paths[idx] = self._fast_check(
+                        col_frame, quirks[idx], self._quirk_keys[idx], i, 0,
+                        '-variable', '', '-command', f"{toggle_command} {idx}")
+        self._set_quirks_mask(0)
         
         # Add button controls at the bottom
         button_frame = ttk.Frame(quirks_container)
@@ -367,34 +413,38 @@ class PersonalityTab(ttk.Frame):
                                         command=lambda: self._toggle_all_quirks(False))
         deselect_all_button.grid(row=0, column=2, padx=5)
     
+    def _toggle_quirk_bit(self, index):
+        """Flip the bit of a quirk after its checkbutton was clicked."""
+        self._quirks_mask ^= 1 << int(index)
+        
+    def _set_quirks_mask(self, mask):
+        """
+        Set the selected quirks and update their checkbuttons to match.
+        
+        Args:
+            mask: Bitmask with bit i set if _quirk_keys[i] is selected
+        """
+        self._quirks_mask = mask
+        for i, path in enumerate(self._quirk_paths):
+            self.tk.call(path, 'state', ('!alternate', 'selected' if mask >> i & 1 else '!selected'))
+            
     def _randomize_quirks(self):
         """Randomly select quirks."""
         import random
         
-        # Get all quirk variables
-        quirk_vars = {k: v for k, v in self._personality_vars.items() if k.startswith('quirk_')}
-        
-        # Reset all to False
-        for var in quirk_vars.values():
-            var.set(False)
-        
         # Random number of quirks to select (between 1 and 1/3 of all quirks)
-        num_quirks = len(quirk_vars)
+        num_quirks = len(self._quirk_keys)
         num_to_select = random.randint(1, max(1, num_quirks // 3))
         
-        # Randomly select some quirks
-        selected_vars = random.sample(list(quirk_vars.values()), num_to_select)
-        for var in selected_vars:
-            var.set(True)
+        # Randomly select some quirks; all others are cleared
+        mask = 0
+        for i in random.sample(range(num_quirks), num_to_select):
+            mask |= 1 << i
+        self._set_quirks_mask(mask)
     
     def _toggle_all_quirks(self, state):
         """Set all quirks to the given state (True/False)."""
-        # Get all quirk variables
-        quirk_vars = {k: v for k, v in self._personality_vars.items() if k.startswith('quirk_')}
-        
-        # Set all to the given state
-        for var in quirk_vars.values():
-            var.set(state)
+        self._set_quirks_mask((1 << len(self._quirk_keys)) - 1 if state else 0)
 
     def _create_questions_subtab(self, parent):
         """Populates the Questions sub-tab with Yes/No questions."""
@@ -428,29 +478,16 @@ class PersonalityTab(ttk.Frame):
             
             # Create variable for this question
             var_name = f"question_{question.lower().replace('?', '').replace(' ', '_')}"
-            self._personality_vars[var_name] = tk.BooleanVar(value=True)  # Default to Yes
+            self._personality_vars[var_name] = tk.BooleanVar(value=True, name=var_name)  # Default to Yes
+            self._question_vars.append(self._personality_vars[var_name])
             
             # Radiobutton frame
             rb_frame = ttk.Frame(question_frame)
             rb_frame.grid(row=0, column=1, padx=20)
             
-            # Yes radiobutton
-            yes_rb = ttk.Radiobutton(
-                rb_frame, 
-                text="Yes",
-                value=True,
-                variable=self._personality_vars[var_name]
-            )
-            yes_rb.grid(row=0, column=0, padx=20)
-            
-            # No radiobutton
-            no_rb = ttk.Radiobutton(
-                rb_frame, 
-                text="No",
-                value=False,
-                variable=self._personality_vars[var_name]
-            )
-            no_rb.grid(row=0, column=1, padx=20)
+            # Yes/No radiobuttons
+            self._fast_radio(rb_frame, "Yes", var_name, 1, 0, 0)
+            self._fast_radio(rb_frame, "No", var_name, 0, 0, 1)
             
         # Button group at the bottom
         button_frame = ttk.Frame(questions_container)
@@ -475,22 +512,14 @@ class PersonalityTab(ttk.Frame):
         """Randomly set Yes/No answers to questions."""
         import random
         
-        # Get all question variables
-        question_vars = {k: v for k, v in self._personality_vars.items() 
-                        if k.startswith('question_')}
-        
         # Set each to a random True/False value
-        for var in question_vars.values():
+        for var in self._question_vars:
             var.set(random.choice([True, False]))
     
     def _set_all_questions(self, value):
         """Set all questions to the same answer (True=Yes, False=No)."""
-        # Get all question variables
-        question_vars = {k: v for k, v in self._personality_vars.items() 
-                        if k.startswith('question_')}
-        
         # Set all to the given value
-        for var in question_vars.values():
+        for var in self._question_vars:
             var.set(value)
 
     def _create_preferences_subtab(self, parent):
@@ -580,6 +609,7 @@ class PersonalityTab(ttk.Frame):
             # Create variable for this question
             var_name = f"rel_dyn_{question.lower().replace('?', '').replace(' ', '_')}"
             self._personality_vars[var_name] = tk.BooleanVar(value=True)  # Default to Yes
+            self._rel_dyn_vars.append(self._personality_vars[var_name])
             
             # Radiobutton frame
             rb_frame = ttk.Frame(q_frame)
@@ -622,6 +652,7 @@ class PersonalityTab(ttk.Frame):
             # Create variable for this question
             var_name = f"comfort_{question.lower().replace('?', '').replace(' ', '_')}"
             self._personality_vars[var_name] = tk.BooleanVar(value=True)  # Default to Yes
+            self._comfort_vars.append(self._personality_vars[var_name])
             
             # Radiobutton frame
             rb_frame = ttk.Frame(q_frame)
@@ -656,6 +687,7 @@ class PersonalityTab(ttk.Frame):
             # Create variable for this trait pair
             var_name = f"trait_{left_trait.lower()}_{right_trait.lower()}"
             self._personality_vars[var_name] = tk.IntVar(value=50)  # Default to middle
+            self._scale_vars.append(self._personality_vars[var_name])
             
             # Scale for the trait
             scale = ttk.Scale(
@@ -789,6 +821,7 @@ class PersonalityTab(ttk.Frame):
                 # Create variable for this style
                 var_name = f"style_{left_style.lower()}"
                 self._personality_vars[var_name] = tk.IntVar(value=50)  # Default to middle
+                self._scale_vars.append(self._personality_vars[var_name])
                 
                 # Scale for the style
                 scale = ttk.Scale(
@@ -824,6 +857,7 @@ class PersonalityTab(ttk.Frame):
             # Variable for this topic
             var_name = f"topic_{topic.lower()}"
             self._personality_vars[var_name] = tk.BooleanVar(value=False)
+            self._topic_vars.append(self._personality_vars[var_name])
             
             # Checkbox
             cb = ttk.Checkbutton(
@@ -845,22 +879,13 @@ class PersonalityTab(ttk.Frame):
         """Randomize all preference settings."""
         import random
         
-        # Get boolean variables (checkboxes and radiobuttons)
-        bool_vars = {k: v for k, v in self._personality_vars.items() 
-                    if isinstance(v, tk.BooleanVar) and 
-                    (k.startswith('comfort_') or k.startswith('rel_dyn_') or k.startswith('topic_'))}
-        
-        # Randomize boolean variables
-        for var in bool_vars.values():
-            var.set(random.choice([True, False]))
-        
-        # Get integer variables (scales)
-        int_vars = {k: v for k, v in self._personality_vars.items() 
-                   if isinstance(v, tk.IntVar) and 
-                   (k.startswith('trait_') or k.startswith('style_'))}
+        # Randomize boolean variables (checkboxes and radiobuttons)
+        for group in (self._rel_dyn_vars, self._comfort_vars, self._topic_vars):
+            for var in group:
+                var.set(random.choice([True, False]))
         
         # Randomize scales
-        for var in int_vars.values():
+        for var in self._scale_vars:
             var.set(random.randint(0, 100))
         
         # Randomize relationship type
@@ -901,6 +926,10 @@ class PersonalityTab(ttk.Frame):
                      self.logger.warning(f"Unhandled widget type for key '{key}': {type(tk_var)}")
             except Exception as e:
                 self.logger.error(f"Error getting value for key '{key}': {e}")
+                
+        # Quirks are stored as one boolean per key, as the LLM prompt expects
+        for i, key in enumerate(self._quirk_keys):
+            self.personality_settings[key] = bool(self._quirks_mask >> i & 1)
 
         # Log the collected settings (for debugging)
         self.logger.info(f"Collected Settings: {self.personality_settings}")
@@ -992,6 +1021,13 @@ class PersonalityTab(ttk.Frame):
             
     def _apply_loaded_settings(self, settings):
         """Apply loaded settings to the UI widgets."""
+        # Quirks missing from the profile keep their current state
+        mask = self._quirks_mask
+        for i, key in enumerate(self._quirk_keys):
+            if key in settings:
+                mask = mask | (1 << i) if settings[key] else mask & ~(1 << i)
+        self._set_quirks_mask(mask)
+        
         for key, value in settings.items():
             if key in self._personality_vars:
                 var = self._personality_vars[key]
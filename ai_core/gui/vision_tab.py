@@ -27,6 +27,10 @@ class VisionTab:
         self.gesture_detect_var = tk.BooleanVar(value=True)
         self.debug_var = tk.BooleanVar(value=False)
         
+        # Canvas image reused across frames; replaced only when the size changes
+        self._vision_photo = None
+        self._vision_canvas_item = None
+        
         self._create_widgets()
         
         # Ensure the widgets are packed correctly
@@ -100,9 +104,11 @@ class VisionTab:
             # Enable vision
             self.main_window.use_vision = True
             
-            # Initialize vision system if needed
+            # Initialize vision system if needed, or restart a stopped one
             if self.main_window.vision_system is None:
                 self._initialize_vision_system()
+            else:
+                self.main_window.vision_system.start()
             
             # Start the vision update loop
             self.main_window._start_vision_update()
@@ -116,6 +122,12 @@ class VisionTab:
             if self.main_window.vision_system:
                 self.main_window.vision_system.stop()
                 
+            # Drop the last frame's image so Tk can free it
+            self.main_window.vision_canvas.delete("all")
+            self.main_window.vision_canvas.image = None
+            self._vision_photo = None
+            self._vision_canvas_item = None
+                
             self.main_window.add_message("System", "Vision system disabled", animate=False)
             self.main_window.status_var.set("Vision system stopped")
             
@@ -156,11 +168,12 @@ class VisionTab:
             # Set debug mode
             self.main_window.vision_system.set_debug_mode(self.debug_var.get())
             
-            # Register callbacks
+            # Register callbacks; frames and info arrive on the capture thread
+            # and are drawn by the main window's UI-thread pump
             self.main_window.vision_system.register_callbacks(
-                on_frame=self._update_vision_canvas,
+                on_frame=self.main_window.post_vision_frame,
                 on_error=self._handle_vision_error,
-                on_info=self._update_vision_info
+                on_info=self.main_window.post_vision_info
             )
             
             # Initialize the camera
@@ -204,21 +217,26 @@ class VisionTab:
                     
                 pil_image = pil_image.resize((new_width, new_height), Image.LANCZOS)
                 
-            # Convert to PhotoImage
-            photo_image = ImageTk.PhotoImage(pil_image)
-            
-            # Clear existing content
-            self.main_window.vision_canvas.delete("all")
-            
-            # Update canvas
-            self.main_window.vision_canvas.create_image(
-                canvas_width // 2, canvas_height // 2,
-                image=photo_image, anchor=tk.CENTER
-            )
-            
-            # Keep a reference to prevent garbage collection
-            self.main_window.vision_canvas.image = photo_image
-            
+            canvas = self.main_window.vision_canvas
+            photo_image = self._vision_photo
+            if photo_image is None or (photo_image.width(), photo_image.height()) != pil_image.size:
+                # New size: allocate a photo and a canvas item for it
+                photo_image = ImageTk.PhotoImage(pil_image)
+                canvas.delete("all")
+                self._vision_canvas_item = canvas.create_image(
+                    canvas_width // 2, canvas_height // 2,
+                    image=photo_image, anchor=tk.CENTER
+                )
+                self._vision_photo = photo_image
+                
+                # Keep a reference to prevent garbage collection
+                canvas.image = photo_image
+            else:
+                # Same size: copy the pixels into the existing photo, which
+                # redraws the canvas item in place
+                photo_image.paste(pil_image)
+                canvas.coords(self._vision_canvas_item, canvas_width // 2, canvas_height // 2)
+                
         except Exception as e:
             self.logger.error(f"Error updating vision canvas: {e}")
             
@@ -400,9 +418,10 @@ class VisionTab:
                 pil_image.save(filename)
                 self.main_window.add_message("System", f"Image captured and saved as '{filename}'", animate=False)
                 
-                # Also show in chat
-                chat_image = pil_image.copy()
-                self.main_window._display_image_in_chat(chat_image)
+                # Also show in chat, scaled to the chat width and queued after
+                # the message above
+                chat_image = self.main_window._fit_chat_image(pil_image)
+                self.main_window.message_queue.put(("image", chat_image))
                 
             else:
                 self.main_window.add_message("System", "Failed to capture image - no frame available", animate=False)
@@ -4,7 +4,7 @@ Interface for LLM-based response generation with content filtering.
 import os
 import json
 import requests
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Iterable, Iterator
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -162,10 +162,10 @@ class LLMInterface:
         
         return text.strip()
         
-    def generate_response(self, emotional_state: Dict[str, Any], user_input: str, 
-                         context: List[Tuple[str, str]] = None) -> str:
+    def _build_request(self, emotional_state: Dict[str, Any], user_input: str,
+                       context: List[Tuple[str, str]] = None) -> Dict[str, Any]:
         """
-        Generate a response based on emotional state, user input, and conversation context.
+        Build the chat completion payload for a response.
         
         Args:
             emotional_state: Current emotional state of the system
@@ -173,13 +173,8 @@ class LLMInterface:
             context: Optional list of prior (user_input, ai_response) exchanges
             
         Returns:
-            str: Generated response
+            Dict[str, Any]: JSON body for the chat completions API
         """
-        # Check content safety
-        is_safe, reason = self.check_content_safety(user_input)
-        if not is_safe:
-            return f"I cannot respond to that type of content. {reason}"
-            
         # Prepare the emotional context
         emotions = emotional_state.get('emotions', {})
         primary_emotion = emotional_state.get('primary_emotion', 'neutral')
@@ -257,6 +252,27 @@ class LLMInterface:
             "temperature": 0.9 if self.content_level == 'adult' else 0.7,
             "max_tokens": 200
         }
+        return data
+        
+    def generate_response(self, emotional_state: Dict[str, Any], user_input: str, 
+                         context: List[Tuple[str, str]] = None) -> str:
+        """
+        Generate a response based on emotional state, user input, and conversation context.
+        
+        Args:
+            emotional_state: Current emotional state of the system
+            user_input: User's input text
+            context: Optional list of prior (user_input, ai_response) exchanges
+            
+        Returns:
+            str: Generated response
+        """
+        # Check content safety
+        is_safe, reason = self.check_content_safety(user_input)
+        if not is_safe:
+            return f"I cannot respond to that type of content. {reason}"
+            
+        data = self._build_request(emotional_state, user_input, context)
         
         try:
             print("Sending request to OpenRouter API...")
@@ -291,6 +307,115 @@ class LLMInterface:
             print(f"Error generating response: {e}")
             return "I encountered an unexpected error."
         
+    def generate_response_stream(self, emotional_state: Dict[str, Any], user_input: str,
+                                 context: List[Tuple[str, str]] = None) -> Iterator[str]:
+        """
+        Generate a response like generate_response, yielding text as it arrives.
+        
+        Only adult mode streams, since its output is not safety checked; the
+        other modes must see the whole response first and yield it in one piece.
+        
+        Args:
+            emotional_state: Current emotional state of the system
+            user_input: User's input text
+            context: Optional list of prior (user_input, ai_response) exchanges
+            
+        Yields:
+            str: Consecutive pieces of the cleaned response
+            
+        Raises:
+            Exception: If the stream fails after part of the response was
+                yielded, so the caller does not mistake it for a full reply
+        """
+        if self.content_level != 'adult':
+            yield self.generate_response(emotional_state, user_input, context)
+            return
+            
+        # Check content safety
+        is_safe, reason = self.check_content_safety(user_input)
+        if not is_safe:
+            yield f"I cannot respond to that type of content. {reason}"
+            return
+            
+        data = self._build_request(emotional_state, user_input, context)
+        data["stream"] = True
+        
+        got_text = False
+        try:
+            print("Sending streaming request to OpenRouter API...")
+            with requests.post(self.api_url, headers=self.headers, json=data, stream=True) as response:
+                print(f"API Response Status: {response.status_code}")
+                
+                if response.status_code != 200:
+                    print(f"Error: {response.text}")
+                    yield "I encountered an error while processing your request."
+                    return
+                    
+                for piece in self._clean_stream(self._iter_stream_deltas(response)):
+                    got_text = True
+                    yield piece
+                    
+        except Exception as e:
+            print(f"Error generating response: {e}")
+            if got_text:
+                raise
+            yield "I encountered an unexpected error."
+            return
+            
+        if not got_text:
+            yield "I'm having trouble formulating a response right now."
+            
+    @staticmethod
+    def _iter_stream_deltas(response) -> Iterator[str]:
+        """Yield the content deltas of a server-sent-events completion stream."""
+        for line in response.iter_lines(decode_unicode=True):
+            # Skip keep-alive comments and blank separator lines
+            if not line or not line.startswith('data: '):
+                continue
+            payload = line[6:]
+            if payload == '[DONE]':
+                break
+            choices = json.loads(payload).get('choices')
+            if choices:
+                content = choices[0].get('delta', {}).get('content')
+                if content:
+                    yield content
+                    
+    def _clean_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Apply clean_response to streamed text as it arrives.
+        
+        The start is held back until an 'AI:' prefix can be ruled out, and
+        trailing whitespace and quotes until more text follows them.
+        """
+        head = ''
+        tail = ''
+        emitted = False
+        for chunk in chunks:
+            chunk = chunk.replace('\r', '').replace('\n', ' ')
+            if head is not None:
+                head += chunk
+                if len(head.lstrip()) < 3:
+                    continue
+                chunk = head.lstrip()
+                if chunk.startswith('AI:'):
+                    chunk = chunk[3:]
+                head = None
+            if not emitted:
+                chunk = chunk.lstrip(' "\'')
+            text = tail + chunk
+            body = text.rstrip(' "\'')
+            tail = text[len(body):]
+            if body:
+                emitted = True
+                yield body
+                
+        # Responses too short to pass the prefix check
+        if head:
+            cleaned = self.clean_response(head)
+            if cleaned:
+                yield cleaned
+        
     def update_personality(self, personality_settings: Dict[str, Any]) -> None:
         """
         Update the AI's personality settings.
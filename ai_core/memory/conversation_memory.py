@@ -1,13 +1,36 @@
 """
 Conversation memory system for maintaining context in conversations.
 """
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Deque, Dict, Any, Iterator, List, Tuple, Optional
+from collections import deque
 from datetime import datetime
+from itertools import islice
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ConversationExchange:
     """Represents a single exchange in a conversation (user input and AI response)."""
+    __slots__ = ('user_input', 'ai_response', 'timestamp', 'metadata')
     
     def __init__(self, user_input: str, ai_response: str, 
                 timestamp: Optional[datetime] = None, 
@@ -55,13 +78,14 @@ class ConversationMemory:
         Args:
             max_exchanges: Maximum number of exchanges to store in memory
         """
-        self.exchanges: List[ConversationExchange] = []
+        # Bounded: appending past max_exchanges drops the oldest in O(1)
+        self.exchanges: Deque[ConversationExchange] = deque(maxlen=max_exchanges)
         self.max_exchanges = max_exchanges
         self.session_start = datetime.now()
         self.session_metadata: Dict[str, Any] = {}
         
     def add_exchange(self, user_input: str, ai_response: str, 
-                    metadata: Optional[Dict[str, Any]] = None) -> None:
+                    metadata: Optional[Dict[str, Any]] = None) -> ConversationExchange:
         """
         Add a new conversation exchange to memory.
         
@@ -69,13 +93,18 @@ class ConversationMemory:
             user_input: The user's input text
             ai_response: The AI's response text
             metadata: Optional additional data about the exchange
+            
+        Returns:
+            The stored exchange
         """
         exchange = ConversationExchange(user_input, ai_response, metadata=metadata)
         self.exchanges.append(exchange)
+        return exchange
         
-        # Maintain the maximum size
-        if len(self.exchanges) > self.max_exchanges:
-            self.exchanges.pop(0)
+    def _iter_recent(self, count: int) -> Iterator[ConversationExchange]:
+        """Iterate over the last count exchanges, oldest first, touching only those."""
+        recent = list(islice(reversed(self.exchanges), count))
+        return reversed(recent)
             
     def get_recent_exchanges(self, count: int = 5) -> List[Tuple[str, str]]:
         """
@@ -87,8 +116,7 @@ class ConversationMemory:
         Returns:
             List of (user_input, ai_response) tuples
         """
-        recent = self.exchanges[-count:] if count < len(self.exchanges) else self.exchanges
-        return [(exchange.user_input, exchange.ai_response) for exchange in recent]
+        return [(exchange.user_input, exchange.ai_response) for exchange in self._iter_recent(count)]
     
     def get_formatted_history(self, count: int = 5) -> str:
         """
@@ -100,10 +128,8 @@ class ConversationMemory:
         Returns:
             Formatted conversation history string
         """
-        recent = self.exchanges[-count:] if count < len(self.exchanges) else self.exchanges
-        
         history = []
-        for exchange in recent:
+        for exchange in self._iter_recent(count):
             history.append(f"User: {exchange.user_input}")
             history.append(f"Assistant: {exchange.ai_response}")
             
@@ -127,7 +153,7 @@ class ConversationMemory:
         
     def clear(self) -> None:
         """Clear all conversation exchanges."""
-        self.exchanges = []
+        self.exchanges.clear()
         self.session_start = datetime.now()
         
     def save_to_file(self, filepath: str) -> None:
@@ -146,31 +172,80 @@ class ConversationMemory:
             'session_metadata': self.session_metadata
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(data, indent=True))
+            
+    @staticmethod
+    def append_to_file(filepath: str, exchange: ConversationExchange) -> None:
+        """
+        Append one exchange to a JSON Lines log.
+        
+        Unlike save_to_file, the cost does not grow with the history, and a
+        crash can lose at most the line being written.
+        
+        Args:
+            filepath: Path of the .jsonl log
+            exchange: Exchange to append
+        """
+        with open(filepath, 'ab') as f:
+            f.write(_dumps(exchange.to_dict()) + b'\n')
             
     def load_from_file(self, filepath: str) -> bool:
         """
         Load conversation history from a file.
         
         Args:
-            filepath: Path to load file from
+            filepath: Path to load file from; a .jsonl file is read as an
+                append_to_file log
             
         Returns:
             True if successful, False otherwise
+            
+        Raises:
+            FileNotFoundError: If filepath does not exist
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if filepath.endswith('.jsonl'):
+                return self._load_from_log(filepath)
                 
-            self.exchanges = [
-                ConversationExchange.from_dict(exchange_data)
-                for exchange_data in data['exchanges']
-            ]
+            with open(filepath, 'rb') as f:
+                data = _loads(f.read())
+                
+            self.exchanges = deque(
+                (ConversationExchange.from_dict(exchange_data)
+                 for exchange_data in data['exchanges']),
+                maxlen=self.max_exchanges
+            )
             self.session_start = datetime.fromisoformat(data['session_start'])
             self.session_metadata = data['session_metadata']
             return True
             
+        except FileNotFoundError:
+            raise
         except Exception as e:
             print(f"Error loading conversation memory: {e}")
-            return False 
\ No newline at end of file
+            return False 
+            
+    def _load_from_log(self, filepath: str) -> bool:
+        """Load conversation history from a JSON Lines log, one exchange per line."""
+        exchanges = deque(maxlen=self.max_exchanges)
+        session_start = None
+        with open(filepath, 'rb') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    exchange = ConversationExchange.from_dict(_loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    # A line torn by a crash mid-write; keep everything else
+                    print(f"Skipping unreadable line {line_no} of {filepath}: {e}")
+                    continue
+                exchanges.append(exchange)
+                if session_start is None:
+                    session_start = exchange.timestamp
+                        
+        # Only the newest max_exchanges are kept, as with add_exchange
+        self.exchanges = exchanges
+        self.session_start = session_start or datetime.now()
+        self.session_metadata = {}
+        return True
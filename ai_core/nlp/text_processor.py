@@ -1,12 +1,21 @@
 """
 Advanced NLP processing for enhanced text understanding and context management.
 """
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, FrozenSet, List, Tuple, Optional
 import spacy
 from textblob import TextBlob
 from collections import deque
+from dataclasses import dataclass
 import re
 
+@dataclass(frozen=True)
+class TokenizedInput:
+    """Words of one input, split once and shared by the text and emotion analyzers."""
+    __slots__ = ('raw', 'tokens', 'token_set')
+    raw: str
+    tokens: Tuple[str, ...]  # Lowercase alphabetic tokens in order
+    token_set: FrozenSet[str]
+
 class TextProcessor:
     def __init__(self):
         """Initialize the NLP processor with necessary models and context tracking."""
@@ -46,7 +55,8 @@ class TextProcessor:
             content_mode: Current content mode (family/mature/adult)
             
         Returns:
-            Dictionary containing extracted features and analysis
+            Dictionary containing extracted features and analysis, including
+            the input's TokenizedInput under 'tokens'
         """
         # Basic text cleaning
         cleaned_text = self._clean_text(text)
@@ -64,6 +74,7 @@ class TextProcessor:
         # Build response dictionary
         analysis = {
             'cleaned_text': cleaned_text,
+            'tokens': self.tokenize(text, doc),
             'entities': entities,
             'sentiment': sentiment,
             'intent': intent,
@@ -78,6 +89,23 @@ class TextProcessor:
         
         return analysis
 
+    def tokenize(self, text: str, doc=None) -> TokenizedInput:
+        """
+        Split text into lowercase words.
+        
+        Args:
+            text: Input text
+            doc: spaCy doc already parsed from the cleaned text, if any; its
+                tokens are reused instead of tokenizing again
+            
+        Returns:
+            TokenizedInput for the text
+        """
+        if doc is None:
+            doc = self.nlp.tokenizer(self._clean_text(text))
+        tokens = tuple(token.lower_ for token in doc if token.is_alpha)
+        return TokenizedInput(text, tokens, frozenset(tokens))
+
     def _clean_text(self, text: str) -> str:
         """Clean and normalize input text."""
         # Remove extra whitespace
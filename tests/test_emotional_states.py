@@ -0,0 +1,38 @@
+"""
+Smoke test for the complex emotional state system.
+"""
+import sys
+import os
+
+# Add the project root directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_core.emotions.emotional_states import ComplexEmotionalSystem, EmotionalState
+
+
+def test_complex_emotional_system():
+    """Construct the system and query a state and a response."""
+    system = ComplexEmotionalSystem()
+
+    state = EmotionalState()
+    state.adjust_emotion('joy', 0.8)
+    state.adjust_emotion('trust', 0.6)
+    name, confidence = system.get_complex_state(state)
+    assert name in system.complex_states or name == 'contemplative'
+    assert 0.0 <= confidence <= 1.0
+
+    context = {
+        'user_emotion': {'joy': 0.6},
+        'environment': {'brightness': 0.5, 'noise_level': 0.2},
+    }
+    response = system.get_emotional_response(name, 'balanced', context)
+    assert set(response) == set(EmotionalState.EMOTION_NAMES)
+    assert response['joy'] > 0.0
+
+    # Unknown personality types fall back to 'balanced'
+    assert system.get_emotional_response(name, 'unknown', context) == response
+
+
+if __name__ == "__main__":
+    test_complex_emotional_system()
+    print("ComplexEmotionalSystem OK")